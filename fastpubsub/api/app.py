@@ -1,14 +1,30 @@
-"""FastAPI application setup and configuration."""
+"""FastAPI application setup and configuration.
 
+The application is served by Uvicorn on the uvloop event loop with the
+httptools HTTP parser, see fastpubsub.api.server.
+"""
+
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+import orjson
 from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.exceptions import RequestValidationError
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import Response
 from prometheus_fastapi_instrumentator import Instrumentator
 
-from fastpubsub import models
-from fastpubsub.api.helpers import _create_error_response
-from fastpubsub.api.middlewares import log_requests
+from fastpubsub.api.helpers import (
+    _create_error_response,
+    _create_validation_error_response,
+    FastORJSONResponse,
+)
+from fastpubsub.api.middlewares import LogRequestsMiddleware, request_start_time
 from fastpubsub.api.routers import clients, monitoring, subscriptions, topics
 from fastpubsub.config import settings
+from fastpubsub.database import engine, warm_up_pool
 from fastpubsub.exceptions import (
     AlreadyExistsError,
     InvalidClient,
@@ -16,6 +32,9 @@ from fastpubsub.exceptions import (
     NotFoundError,
     ServiceUnavailable,
 )
+from fastpubsub.logger import get_logger
+
+logger = get_logger(__name__)
 
 tags_metadata = [
     {
@@ -36,107 +55,128 @@ tags_metadata = [
     },
 ]
 
+# Shared by every application instance so the metric collectors are only registered once.
+# Probes and the metrics endpoint itself are scraped constantly and are left out of the request metrics.
+_instrumentator = Instrumentator(excluded_handlers=["/liveness", "/readiness", "/metrics"])
 
-def create_app() -> FastAPI:
-    """Create and configure the FastAPI application.
+# HTTP status code returned for each domain exception
+_ERROR_STATUS_CODES: dict[type[Exception], int] = {
+    AlreadyExistsError: status.HTTP_409_CONFLICT,
+    NotFoundError: status.HTTP_404_NOT_FOUND,
+    ServiceUnavailable: status.HTTP_503_SERVICE_UNAVAILABLE,
+    InvalidClient: status.HTTP_401_UNAUTHORIZED,
+    InvalidClientToken: status.HTTP_403_FORBIDDEN,
+}
 
-    Sets up the complete application including middleware, exception handlers,
-    routers, and monitoring instrumentation.
+
+async def domain_exception_handler(request: Request, exc: Exception):
+    """Handle the domain exceptions listed in _ERROR_STATUS_CODES.
+
+    Returns a JSON error response with the status code mapped to the exception
+    class and the exception message as detail. Subclasses resolve to the
+    status code of their nearest listed base class, the same way Starlette
+    routes them to this handler.
+
+    Args:
+        request: The incoming HTTP request.
+        exc: The domain exception.
 
     Returns:
-        Configured FastAPI application instance.
+        JSON error response with the mapped status code.
     """
-    app = FastAPI(
-        title="fastpubsub",
-        description="Simple pubsub system based on FastAPI and PostgreSQL.",
-        debug=settings.api_debug,
-        default_response_class=ORJSONResponse,
-    )
+    status_code = next(_ERROR_STATUS_CODES[cls] for cls in type(exc).__mro__ if cls in _ERROR_STATUS_CODES)
+    return _create_error_response(status_code, exc.args[0])
 
-    # Add middleware
-    app.middleware("http")(log_requests)
 
-    # Add exception handlers
-    @app.exception_handler(AlreadyExistsError)
-    def already_exists_exception_handler(request: Request, exc: AlreadyExistsError):
-        """Handle AlreadyExistsError exceptions.
+def _serve_precomputed_openapi(app: FastAPI) -> None:
+    """Serve the OpenAPI document from bytes rendered once.
 
-        Returns a 409 Conflict response when attempting to create resources that already exist.
+    FastAPI caches the schema dictionary but encodes it again on every
+    request to the OpenAPI URL. The schema is built and encoded here, after
+    all routes are registered, and the default route is replaced by one that
+    returns the pre-rendered bytes.
 
-        Args:
-            request: The incoming HTTP request.
-            exc: The AlreadyExistsError exception.
+    Args:
+        app: The FastAPI application instance.
+    """
+    if app.openapi_url is None:
+        return
 
-        Returns:
-            JSON error response with 409 status code.
-        """
-        return _create_error_response(models.GenericError, status.HTTP_409_CONFLICT, exc)
+    body = orjson.dumps(app.openapi())
 
-    @app.exception_handler(NotFoundError)
-    def not_found_exception_handler(request: Request, exc: NotFoundError):
-        """Handle NotFoundError exceptions.
+    async def openapi(request: Request) -> Response:
+        return Response(content=body, media_type="application/json")
 
-        Returns a 404 Not Found response when requesting non-existent resources.
+    app.router.routes = [
+        route for route in app.router.routes if getattr(route, "path", None) != app.openapi_url
+    ]
+    app.add_route(app.openapi_url, openapi, include_in_schema=False)
 
-        Args:
-            request: The incoming HTTP request.
-            exc: The NotFoundError exception.
 
-        Returns:
-            JSON error response with 404 status code.
-        """
-        return _create_error_response(models.GenericError, status.HTTP_404_NOT_FOUND, exc)
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Manage the database connection pool over the application lifetime.
 
-    @app.exception_handler(ServiceUnavailable)
-    def service_unavailable_exception_handler(request: Request, exc: ServiceUnavailable):
-        """Handle ServiceUnavailable exceptions.
+    Warms up the connection pool on startup and disposes of it on shutdown.
 
-        Returns a 503 Service Unavailable response when services are unavailable.
+    Args:
+        app: The FastAPI application instance.
+    """
+    await warm_up_pool()
+    yield
+    await engine.dispose()
 
-        Args:
-            request: The incoming HTTP request.
-            exc: The ServiceUnavailable exception.
 
-        Returns:
-            JSON error response with 503 status code.
-        """
-        return _create_error_response(models.GenericError, status.HTTP_503_SERVICE_UNAVAILABLE, exc)
+def create_app() -> FastAPI:
+    """Create and configure the FastAPI application.
 
-    @app.exception_handler(InvalidClient)
-    def invalid_client_exception_handler(request: Request, exc: InvalidClient):
-        """Handle InvalidClient exceptions.
+    Sets up the complete application including middleware, exception handlers,
+    routers, and monitoring instrumentation (unless api_metrics_enabled is off).
 
-        Returns a 401 Unauthorized response when client authentication fails.
+    Returns:
+        Configured FastAPI application instance.
+    """
+    app = FastAPI(
+        title="fastpubsub",
+        description="Simple pubsub system based on FastAPI and PostgreSQL.",
+        debug=settings.api_debug,
+        default_response_class=FastORJSONResponse,
+        lifespan=lifespan,
+    )
 
-        Args:
-            request: The incoming HTTP request.
-            exc: The InvalidClient exception.
+    # Add middleware
+    app.add_middleware(
+        GZipMiddleware,
+        minimum_size=settings.api_gzip_minimum_size,
+        compresslevel=settings.api_gzip_compresslevel,
+    )
+    app.add_middleware(LogRequestsMiddleware)
 
-        Returns:
-            JSON error response with 401 status code.
-        """
-        return _create_error_response(models.GenericError, status.HTTP_401_UNAUTHORIZED, exc)
+    # Add exception handlers
+    for exc_class in _ERROR_STATUS_CODES:
+        app.add_exception_handler(exc_class, domain_exception_handler)
 
-    @app.exception_handler(InvalidClientToken)
-    def invalid_client_token_exception_handler(request: Request, exc: InvalidClientToken):
-        """Handle InvalidClientToken exceptions.
+    @app.exception_handler(RequestValidationError)
+    async def request_validation_exception_handler(request: Request, exc: RequestValidationError):
+        """Handle RequestValidationError exceptions.
 
-        Returns a 403 Forbidden response when client token is invalid or expired.
+        Returns a 422 Unprocessable Content response with the validation errors,
+        encoded with orjson instead of jsonable_encoder.
 
         Args:
             request: The incoming HTTP request.
-            exc: The InvalidClientToken exception.
+            exc: The RequestValidationError exception.
 
         Returns:
-            JSON error response with 403 status code.
+            JSON error response with 422 status code.
         """
-        return _create_error_response(models.GenericError, status.HTTP_403_FORBIDDEN, exc)
+        return _create_validation_error_response(exc.errors())
 
     @app.exception_handler(Exception)
-    def generic_exception_handler(request: Request, exc: Exception):
+    async def generic_exception_handler(request: Request, exc: Exception):
         """Handle generic Exception instances.
 
-        Catches any unhandled exceptions that don't have specific handlers.
+        Catches any unhandled exceptions that don't have specific handlers and logs them.
         Returns a generic 500 Internal Server Error response to avoid leaking
         sensitive information about the application internals.
 
@@ -147,9 +187,12 @@ def create_app() -> FastAPI:
         Returns:
             JSON error response with 500 status code and generic error message.
         """
-        return JSONResponse(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, content={"detail": "internal server error"}
-        )
+        start_time = request_start_time.get()
+        extra: dict[str, Any] = {"error": str(exc)}
+        if start_time is not None:
+            extra["time_us"] = (time.perf_counter_ns() - start_time) // 1000
+        logger.error("request_failed", extra=extra)
+        return _create_error_response(status.HTTP_500_INTERNAL_SERVER_ERROR, "internal server error")
 
     # Add routers
     app.include_router(topics.router)
@@ -158,6 +201,9 @@ def create_app() -> FastAPI:
     app.include_router(clients.router)
 
     # Add Prometheus instrumentation
-    Instrumentator().instrument(app).expose(app)
+    if settings.api_metrics_enabled:
+        _instrumentator.instrument(app).expose(app, include_in_schema=False)
+
+    _serve_precomputed_openapi(app)
 
     return app
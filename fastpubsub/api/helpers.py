@@ -1,19 +1,351 @@
 """Helper functions for API responses and error handling."""
 
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
+import hashlib
+from collections.abc import Awaitable, Callable, Coroutine, Sequence
+from functools import lru_cache
+from typing import Annotated, Any
 
+import orjson
+from fastapi import Query, Request, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import Response
+from fastapi.routing import APIRoute
+from pydantic import (
+    BaseModel,
+    Field,
+    GetPydanticSchema,
+    StringConstraints,
+    TypeAdapter,
+    ValidationError,
+    WithJsonSchema,
+)
+from pydantic_core import core_schema
 
-def _create_error_response(model_class, status_code: int, exc: Exception):
-    """Create a standardized error response JSON object.
+from fastpubsub import models
+
+# Error response descriptors shared by the routers for OpenAPI documentation
+_ERR_404: dict[int | str, dict[str, Any]] = {404: {"model": models.GenericError}}
+_ERR_409: dict[int | str, dict[str, Any]] = {409: {"model": models.GenericError}}
+_ERR_503: dict[int | str, dict[str, Any]] = {503: {"model": models.GenericError}}
+
+# Pagination query parameters shared by the list endpoints
+_Offset = Annotated[int, Query(ge=0, description="Number of items to skip.")]
+_Limit = Annotated[int, Query(ge=1, le=100, description="Maximum number of items to return.")]
+
+# Cache-Control values for read-only endpoints
+_CACHE_CONTROL_ENTITY = "private, max-age=5"
+_CACHE_CONTROL_PROBE = "max-age=1"
+# Counters change constantly, clients must revalidate but can still get a 304
+_CACHE_CONTROL_METRICS = "private, no-cache"
+
+_UUID_REGEX = r"^[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}$"
+
+# Message ids are kept as strings and cast to uuid by PostgreSQL. They still report uuid_parsing
+# errors and are documented as uuid strings, as they were when the body was declared as list[UUID].
+_MessageId = Annotated[
+    str,
+    StringConstraints(pattern=_UUID_REGEX),
+    GetPydanticSchema(
+        lambda source, handler: core_schema.custom_error_schema(
+            handler(source),
+            custom_error_type="uuid_parsing",
+            custom_error_context={"error": "invalid UUID format"},
+        )
+    ),
+    WithJsonSchema({"type": "string", "format": "uuid"}),
+]
+
+# Request body adapters, built once at import time and validated straight from the raw JSON bytes
+_MESSAGE_IDS_ADAPTER: TypeAdapter[list[str]] = TypeAdapter(Annotated[list[_MessageId], Field(title="Data")])
+_MESSAGES_ADAPTER: TypeAdapter[list[dict[str, Any]]] = TypeAdapter(
+    Annotated[list[dict[str, Any]], Field(title="Data")]
+)
+
+# Response list adapters, list items are dumped to JSON by the compiled serializer in a single call
+_TOPIC_LIST_ADAPTER = TypeAdapter(list[models.Topic])
+_SUBSCRIPTION_LIST_ADAPTER = TypeAdapter(list[models.Subscription])
+_MESSAGE_LIST_ADAPTER = TypeAdapter(list[models.Message])
+_CLIENT_LIST_ADAPTER = TypeAdapter(list[models.Client])
+
+
+def _default(obj: Any) -> Any:
+    """Convert objects that orjson does not handle natively.
+
+    Args:
+        obj: Object that orjson could not serialize.
+
+    Returns:
+        A serializable representation of the object.
+
+    Raises:
+        TypeError: If the object type is not supported.
+    """
+    if isinstance(obj, BaseModel):
+        return obj.__pydantic_serializer__.to_python(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _render_json(content: Any) -> bytes:
+    """Render content as JSON bytes with orjson.
+
+    Args:
+        content: Content to serialize.
+
+    Returns:
+        The JSON encoded content.
+    """
+    return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z)
+
+
+def _render_list(adapter: TypeAdapter, items: list[Any]) -> bytes:
+    """Render a list response body, the items wrapped as {"data": [...]}.
+
+    Args:
+        adapter: TypeAdapter for the list of items.
+        items: Items to serialize.
+
+    Returns:
+        The JSON encoded body.
+    """
+    return b'{"data":' + adapter.dump_json(items) + b"}"
+
+
+def _list_response(adapter: TypeAdapter, items: list[Any]) -> Response:
+    """Create a JSON list response, the items wrapped as {"data": [...]}.
+
+    Args:
+        adapter: TypeAdapter for the list of items.
+        items: Items to serialize.
+
+    Returns:
+        The JSON response.
+    """
+    return Response(content=_render_list(adapter, items), media_type="application/json")
+
+
+class FastORJSONResponse(Response):
+    """JSON response rendered directly with orjson.
+
+    Pydantic models are dumped through their compiled serializer, so the
+    content never goes through jsonable_encoder.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        """Render the content as JSON bytes.
+
+        Args:
+            content: Content to serialize.
+
+        Returns:
+            The JSON encoded content.
+        """
+        return _render_json(content)
+
+
+class ORJSONRequest(Request):
+    """Request that parses its JSON body with orjson."""
+
+    async def json(self) -> Any:
+        """Parse the request body as JSON.
+
+        Returns:
+            The decoded JSON body.
+
+        Raises:
+            orjson.JSONDecodeError: If the body is not valid JSON.
+        """
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """API route that hands ORJSONRequest instances to FastAPI's body parsing."""
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        """Wrap the default route handler to use ORJSONRequest.
+
+        Returns:
+            The route handler.
+        """
+        route_handler = super().get_route_handler()
+
+        async def orjson_route_handler(request: Request) -> Response:
+            return await route_handler(ORJSONRequest(request.scope, request.receive))
+
+        return orjson_route_handler
+
+
+def _make_etag(body: bytes) -> str:
+    """Compute a weak ETag for a response body.
+
+    Args:
+        body: The rendered response body.
+
+    Returns:
+        The weak ETag header value.
+    """
+    return f'W/"{hashlib.blake2s(body, digest_size=8).hexdigest()}"'
+
+
+def _conditional_response(
+    request: Request, body: bytes, cache_control: str, etag: str | None = None
+) -> Response:
+    """Create a JSON response for a pre-rendered body with ETag and Cache-Control headers.
+
+    When the ETag matches the request If-None-Match header, an empty 304
+    Not Modified response is returned instead.
+
+    Args:
+        request: The incoming HTTP request.
+        body: The rendered JSON body.
+        cache_control: Value of the Cache-Control header.
+        etag: Precomputed ETag of the body, computed from the body if omitted.
+
+    Returns:
+        The JSON response, or a 304 response if the client copy is still valid.
+    """
+    if etag is None:
+        etag = _make_etag(body)
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if "*" in tags or etag.removeprefix("W/") in tags:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _etag_response(request: Request, content: Any, cache_control: str) -> Response:
+    """Create a JSON response with ETag and Cache-Control headers.
+
+    The ETag is a hash of the rendered body. When it matches the request
+    If-None-Match header, an empty 304 Not Modified response is returned.
+
+    Args:
+        request: The incoming HTTP request.
+        content: Content to serialize.
+        cache_control: Value of the Cache-Control header.
+
+    Returns:
+        The JSON response, or a 304 response if the client copy is still valid.
+    """
+    return _conditional_response(request, _render_json(content), cache_control)
+
+
+@lru_cache(maxsize=256)
+def _render_error_body(detail: str) -> bytes:
+    """Render the JSON body of an error response.
+
+    Error details are mostly constant strings, so rendered bodies are cached.
+
+    Args:
+        detail: Human-readable error message.
+
+    Returns:
+        The JSON encoded error body.
+    """
+    return orjson.dumps({"detail": detail})
+
+
+def _create_error_response(status_code: int, detail: str) -> Response:
+    """Create a standardized error response.
 
     Args:
-        model_class: Pydantic model class for the error response.
         status_code: HTTP status code for the error.
-        exc: Exception instance containing the error message.
+        detail: Human-readable error message.
 
     Returns:
-        JSONResponse with formatted error content and appropriate status code.
+        Response with the JSON error body and appropriate status code.
     """
-    response = jsonable_encoder(model_class(detail=exc.args[0]))
-    return JSONResponse(status_code=status_code, content=response)
+    return Response(
+        content=_render_error_body(detail), status_code=status_code, media_type="application/json"
+    )
+
+
+def _error_default(obj: Any) -> Any:
+    """Convert validation error values that orjson does not handle natively.
+
+    Args:
+        obj: Object that orjson could not serialize.
+
+    Returns:
+        A serializable representation of the object.
+    """
+    if isinstance(obj, bytes):
+        return obj.decode(errors="replace")
+    if isinstance(obj, BaseModel):
+        return obj.__pydantic_serializer__.to_python(obj, mode="json")
+    return str(obj)
+
+
+def _create_validation_error_response(errors: Sequence[Any]) -> Response:
+    """Create a 422 response for request validation errors.
+
+    Args:
+        errors: Validation errors as returned by RequestValidationError.errors().
+
+    Returns:
+        Response with the JSON encoded errors under "detail".
+    """
+    return Response(
+        content=orjson.dumps({"detail": errors}, default=_error_default),
+        status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+        media_type="application/json",
+    )
+
+
+def _json_body(adapter: TypeAdapter) -> Callable[[Request], Awaitable[Any]]:
+    """Build a dependency that validates the raw request body with a TypeAdapter.
+
+    Args:
+        adapter: TypeAdapter used to validate the JSON body.
+
+    Returns:
+        Async dependency returning the validated body.
+    """
+
+    async def dependency(request: Request) -> Any:
+        """Validate the request body.
+
+        Args:
+            request: The incoming HTTP request.
+
+        Returns:
+            The validated body.
+
+        Raises:
+            RequestValidationError: If the body doesn't match the adapter type.
+        """
+        try:
+            return adapter.validate_json(await request.body())
+        except ValidationError as exc:
+            errors = [{**error, "loc": ("body", *error["loc"])} for error in exc.errors(include_url=False)]
+            raise RequestValidationError(errors) from None
+
+    return dependency
+
+
+def _json_body_openapi(adapter: TypeAdapter) -> dict[str, Any]:
+    """Build the OpenAPI request body for an endpoint using _json_body.
+
+    Args:
+        adapter: TypeAdapter used to validate the JSON body.
+
+    Returns:
+        Dictionary to be used as the route openapi_extra.
+    """
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": adapter.json_schema()}},
+        }
+    }
+
+
+_message_ids_body = _json_body(_MESSAGE_IDS_ADAPTER)
+_messages_body = _json_body(_MESSAGES_ADAPTER)
+_MESSAGE_IDS_OPENAPI = _json_body_openapi(_MESSAGE_IDS_ADAPTER)
+_MESSAGES_OPENAPI = _json_body_openapi(_MESSAGES_ADAPTER)
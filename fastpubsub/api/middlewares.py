@@ -1,73 +1,89 @@
 """HTTP middleware for request logging and monitoring."""
 
+import logging
 import time
+from contextvars import ContextVar
 from uuid import uuid7
 
-from fastapi import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from fastpubsub.logger import get_logger
+from fastpubsub.logger import get_logger, request_context
 
 logger = get_logger(__name__)
 
+# perf_counter_ns() value at the start of the request being handled
+request_start_time: ContextVar[int | None] = ContextVar("request_start_time", default=None)
 
-async def log_requests(request: Request, call_next):
-    """Middleware to log HTTP requests and responses with timing and request IDs.
+# Probe and metrics endpoints are hit constantly by orchestrators and scrapers, so they are not logged
+_SKIP_LOG_PATHS = frozenset({"/liveness", "/readiness", "/metrics"})
+
+
+class LogRequestsMiddleware:
+    """ASGI middleware to log HTTP requests and responses with timing and request IDs.
 
     This middleware:
     - Generates a unique request ID for tracking
-    - Logs request details at the start
+    - Stores the request details in the request_context variable, so every log
+      record emitted while handling the request carries them
+    - Logs request details at the start (debug level only)
     - Measures processing time
     - Logs response details including status code and timing
     - Adds request ID header to response
-    - Handles and logs any exceptions during request processing
+
+    Unhandled exceptions are not caught here, they are logged by the application's
+    generic exception handler. Requests to the paths in _SKIP_LOG_PATHS are passed
+    through untouched. It works on the raw ASGI scope and messages, so no Request
+    object is built and the response body is streamed as is.
 
     Args:
-        request: The incoming FastAPI request.
-        call_next: The next middleware or endpoint to call.
+        app: The ASGI application to wrap.
+    """
 
-    Returns:
-        The processed HTTP response.
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-    Raises:
-        Exception: Re-raises any exceptions encountered during processing.
-    """
-    start_time = time.perf_counter()
-    request_id = str(uuid7())
-    logger.info(
-        "request",
-        extra={
-            "request.client.host": request.client.host,
-            "request.method": request.method,
-            "request.url.path": request.url.path,
-        },
-    )
-
-    try:
-        response = await call_next(request)
-        response.headers["X-Request-ID"] = request_id
-    except Exception as exc:
-        process_time = time.perf_counter() - start_time
-        logger.error(
-            "request_failed",
-            extra={
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle an ASGI call.
+
+        Args:
+            scope: The ASGI connection scope.
+            receive: The ASGI receive channel.
+            send: The ASGI send channel.
+        """
+        if scope["type"] != "http" or scope["path"] in _SKIP_LOG_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter_ns()
+        request_start_time.set(start_time)
+        # The request ID is opaque, so the dash-less hex form is used to skip UUID.__str__ formatting
+        request_id = uuid7().hex
+        request_id_header = (b"x-request-id", request_id.encode())
+        client = scope.get("client")
+        # ASGI servers run each request in its own task, so the context does not leak between requests
+        request_context.set(
+            {
                 "request_id": request_id,
-                "error": str(exc),
-                "time": f"{process_time:.4f}s",
-            },
+                "request.client.host": client[0] if client else None,
+                "request.method": scope["method"],
+                "request.url.path": scope["path"],
+            }
         )
-        raise
-
-    end_time = time.perf_counter()
-    process_time = end_time - start_time
-    logger.info(
-        "response",
-        extra={
-            "request.client.host": request.client.host,
-            "request.method": request.method,
-            "request.url.path": request.url.path,
-            "response.status_code": response.status_code,
-            "time": f"{process_time:.4f}s",
-        },
-    )
-
-    return response
+        status_code = None
+
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message["headers"] = [*message.get("headers", ()), request_id_header]
+            await send(message)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("request")
+
+        await self.app(scope, receive, send_with_request_id)
+
+        if logger.isEnabledFor(logging.INFO):
+            # Integer microseconds, formatting is left to the log formatter
+            elapsed_us = (time.perf_counter_ns() - start_time) // 1000
+            logger.info("response", extra={"response.status_code": status_code, "time_us": elapsed_us})
@@ -3,11 +3,20 @@
 import uuid
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, status
 
 from fastpubsub import models, services
+from fastpubsub.api.helpers import (
+    _CLIENT_LIST_ADAPTER,
+    _ERR_404,
+    _Limit,
+    _list_response,
+    _Offset,
+    FastORJSONResponse,
+    ORJSONRoute,
+)
 
-router = APIRouter(tags=["clients"])
+router = APIRouter(tags=["clients"], default_response_class=FastORJSONResponse, route_class=ORJSONRoute)
 
 
 @router.post(
@@ -30,20 +39,21 @@ async def create_client(
         token: Decoded client token with 'clients:create' scope.
 
     Returns:
-        CreateClientResult containing the new client ID and secret.
+        JSON response with the new client ID and secret.
 
     Raises:
         AlreadyExistsError: If a client with the same ID already exists.
         InvalidClient: If the requesting client lacks 'clients:create' scope.
     """
-    return await services.create_client(data)
+    result = await services.create_client(data)
+    return FastORJSONResponse(result, status_code=status.HTTP_201_CREATED)
 
 
 @router.get(
     "/clients/{id}",
     response_model=models.Client,
     status_code=status.HTTP_200_OK,
-    responses={404: {"model": models.GenericError}},
+    responses=_ERR_404,
     summary="Get a client",
 )
 async def get_client(
@@ -60,20 +70,21 @@ async def get_client(
         token: Decoded client token with 'clients:read' scope.
 
     Returns:
-        Client model with full client details.
+        JSON response with the full client details.
 
     Raises:
         NotFoundError: If no client with the given ID exists.
         InvalidClient: If the requesting client lacks 'clients:read' scope.
     """
-    return await services.get_client(id)
+    client = await services.get_client(id)
+    return FastORJSONResponse(client)
 
 
 @router.put(
     "/clients/{id}",
     response_model=models.Client,
     status_code=status.HTTP_200_OK,
-    responses={404: {"model": models.GenericError}},
+    responses=_ERR_404,
     summary="Update a client",
 )
 async def update_client(
@@ -92,13 +103,14 @@ async def update_client(
         token: Decoded client token with 'clients:update' scope.
 
     Returns:
-        Client model with updated details.
+        JSON response with the updated client details.
 
     Raises:
         NotFoundError: If no client with the given ID exists.
         InvalidClient: If the requesting client lacks 'clients:update' scope.
     """
-    return await services.update_client(id, data)
+    client = await services.update_client(id, data)
+    return FastORJSONResponse(client)
 
 
 @router.get(
@@ -109,8 +121,8 @@ async def update_client(
 )
 async def list_client(
     token: Annotated[models.DecodedClientToken, Depends(services.require_scope("clients", "read"))],
-    offset: int = Query(default=0, ge=0),
-    limit: int = Query(default=10, ge=1, le=100),
+    offset: _Offset = 0,
+    limit: _Limit = 10,
 ):
     """List clients with pagination support.
 
@@ -122,19 +134,19 @@ async def list_client(
         limit: Maximum number of items to return (1-100).
 
     Returns:
-        ListClientAPI containing the list of clients.
+        JSON response with the list of clients under "data".
 
     Raises:
         InvalidClient: If the requesting client lacks 'clients:read' scope.
     """
     clients = await services.list_client(offset, limit)
-    return models.ListClientAPI(data=clients)
+    return _list_response(_CLIENT_LIST_ADAPTER, clients)
 
 
 @router.delete(
     "/clients/{id}",
     status_code=status.HTTP_204_NO_CONTENT,
-    responses={404: {"model": models.GenericError}},
+    responses=_ERR_404,
     summary="Delete a client",
 )
 async def delete_client(
@@ -173,10 +185,13 @@ async def issue_client_token(data: models.IssueClientToken):
         data: Client credentials including ID and secret for authentication.
 
     Returns:
-        ClientToken containing the access token, type, expiration, and scopes.
+        JSON response with the access token, type, expiration, and scopes.
 
     Raises:
         InvalidClient: If client ID or secret is invalid.
         ServiceUnavailable: If token generation service is unavailable.
     """
-    return await services.issue_jwt_client_token(client_id=data.client_id, client_secret=data.client_secret)
+    client_token = await services.issue_jwt_client_token(
+        client_id=data.client_id, client_secret=data.client_secret
+    )
+    return FastORJSONResponse(client_token, status_code=status.HTTP_201_CREATED)
@@ -1,11 +1,54 @@
 """API endpoints for monitoring and health check operations."""
 
-from fastapi import APIRouter, status
+import time
+
+import orjson
+from fastapi import APIRouter, Request, status
+from fastapi.responses import Response
+from sqlalchemy.exc import SQLAlchemyError
 
 from fastpubsub import models, services
+from fastpubsub.api.helpers import (
+    _CACHE_CONTROL_PROBE,
+    _conditional_response,
+    _ERR_503,
+    _make_etag,
+    FastORJSONResponse,
+)
 from fastpubsub.exceptions import ServiceUnavailable
 
-router = APIRouter(tags=["monitoring"])
+router = APIRouter(tags=["monitoring"], default_response_class=FastORJSONResponse)
+
+# Probe bodies are constant, so they are rendered once at import time
+_LIVENESS_BODY = orjson.dumps({"status": "alive"})
+_LIVENESS_ETAG = _make_etag(_LIVENESS_BODY)
+_READINESS_BODY = orjson.dumps({"status": "ready"})
+
+# Readiness probes only hit the database once per window, the last result is reused in between
+_READINESS_CACHE_SECONDS = 1.0
+_readiness_cache: tuple[float, bool] | None = None
+
+
+async def _cached_database_ping() -> bool:
+    """Check database connectivity, reusing a result younger than _READINESS_CACHE_SECONDS.
+
+    Database and connection errors count as unreachable, other exceptions are
+    propagated.
+
+    Returns:
+        True if database is reachable, False otherwise.
+    """
+    global _readiness_cache
+    now = time.monotonic()
+    if _readiness_cache is not None and now - _readiness_cache[0] < _READINESS_CACHE_SECONDS:
+        return _readiness_cache[1]
+
+    try:
+        is_db_ok = await services.database_ping()
+    except (SQLAlchemyError, OSError, TimeoutError):
+        is_db_ok = False
+    _readiness_cache = (now, is_db_ok)
+    return is_db_ok
 
 
 @router.get(
@@ -14,7 +57,7 @@ router = APIRouter(tags=["monitoring"])
     status_code=status.HTTP_200_OK,
     summary="Liveness probe",
 )
-async def liveness_probe():
+async def liveness_probe(request: Request):
     """Check if the application is alive.
 
     Simple liveness check that always returns "alive" status.
@@ -22,36 +65,33 @@ async def liveness_probe():
     if the application process is running.
 
     Returns:
-        HealthCheck model with status "alive".
+        JSON response with status "alive", cacheable for one second.
     """
-    return models.HealthCheck(status="alive")
+    return _conditional_response(request, _LIVENESS_BODY, _CACHE_CONTROL_PROBE, _LIVENESS_ETAG)
 
 
 @router.get(
     "/readiness",
     response_model=models.HealthCheck,
     status_code=status.HTTP_200_OK,
-    responses={503: {"model": models.GenericError}},
+    responses=_ERR_503,
     summary="Readiness probe",
 )
 async def readiness_probe():
     """Check if the application is ready to serve traffic.
 
-    Comprehensive health check that verifies database connectivity.
+    Comprehensive health check that verifies database connectivity. The database
+    check result is reused for up to one second.
     Returns "ready" status only if all critical dependencies are available.
     Used by Kubernetes to determine if the application can handle requests.
 
     Returns:
-        HealthCheck model with status "ready".
+        JSON response with status "ready".
 
     Raises:
         ServiceUnavailable: If database connection fails.
     """
-    try:
-        is_db_ok = await services.database_ping()
-        if not is_db_ok:
-            raise ServiceUnavailable("database is down")
-    except Exception:
-        raise ServiceUnavailable("database is down") from None
+    if not await _cached_database_ping():
+        raise ServiceUnavailable("database is down")
 
-    return models.HealthCheck(status="ready")
+    return Response(content=_READINESS_BODY, media_type="application/json")
@@ -1,20 +1,42 @@
 """API endpoints for subscription management and message operations."""
 
 from typing import Annotated
-from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, status
 
 from fastpubsub import models, services
+from fastpubsub.api.helpers import (
+    _CACHE_CONTROL_ENTITY,
+    _CACHE_CONTROL_METRICS,
+    _conditional_response,
+    _ERR_404,
+    _ERR_409,
+    _etag_response,
+    _Limit,
+    _list_response,
+    _message_ids_body,
+    _MESSAGE_IDS_OPENAPI,
+    _MESSAGE_LIST_ADAPTER,
+    _Offset,
+    _render_list,
+    _SUBSCRIPTION_LIST_ADAPTER,
+    FastORJSONResponse,
+    ORJSONRoute,
+)
 
-router = APIRouter(prefix="/subscriptions", tags=["subscriptions"])
+router = APIRouter(
+    prefix="/subscriptions",
+    tags=["subscriptions"],
+    default_response_class=FastORJSONResponse,
+    route_class=ORJSONRoute,
+)
 
 
 @router.post(
     "",
     response_model=models.Subscription,
     status_code=status.HTTP_201_CREATED,
-    responses={409: {"model": models.GenericError}},
+    responses=_ERR_409,
     summary="Create a subscription",
 )
 async def create_subscription(
@@ -31,25 +53,27 @@ async def create_subscription(
         token: Decoded client token with 'subscriptions:create' scope.
 
     Returns:
-        Subscription model with the created subscription details.
+        JSON response with the created subscription details.
 
     Raises:
         AlreadyExistsError: If a subscription with the same ID already exists.
         NotFoundError: If the specified topic doesn't exist.
         InvalidClient: If the requesting client lacks 'subscriptions:create' scope.
     """
-    return await services.create_subscription(data)
+    subscription = await services.create_subscription(data)
+    return FastORJSONResponse(subscription, status_code=status.HTTP_201_CREATED)
 
 
 @router.get(
     "/{id}",
     response_model=models.Subscription,
     status_code=status.HTTP_200_OK,
-    responses={404: {"model": models.GenericError}},
+    responses=_ERR_404,
     summary="Get a subscription",
 )
 async def get_subscription(
     id: str,
+    request: Request,
     token: Annotated[models.DecodedClientToken, Depends(services.require_scope("subscriptions", "read"))],
 ):
     """Retrieve a subscription by ID.
@@ -62,13 +86,14 @@ async def get_subscription(
         token: Decoded client token with 'subscriptions:read' scope.
 
     Returns:
-        Subscription model with full subscription details.
+        JSON response with the subscription details and an ETag, or 304 if the client copy is current.
 
     Raises:
         NotFoundError: If no subscription with the given ID exists.
         InvalidClient: If the requesting client lacks 'subscriptions:read' scope.
     """
-    return await services.get_subscription(id)
+    subscription = await services.get_subscription(id)
+    return _etag_response(request, subscription, _CACHE_CONTROL_ENTITY)
 
 
 @router.get(
@@ -78,9 +103,10 @@ async def get_subscription(
     summary="List subscriptions",
 )
 async def list_subscription(
+    request: Request,
     token: Annotated[models.DecodedClientToken, Depends(services.require_scope("subscriptions", "read"))],
-    offset: int = Query(default=0, ge=0),
-    limit: int = Query(default=10, ge=1, le=100),
+    offset: _Offset = 0,
+    limit: _Limit = 10,
 ):
     """List subscriptions with pagination support.
 
@@ -92,19 +118,21 @@ async def list_subscription(
         limit: Maximum number of items to return (1-100).
 
     Returns:
-        ListSubscriptionAPI containing the list of subscriptions.
+        JSON response with the list of subscriptions under "data" and an ETag, or 304 if unchanged.
 
     Raises:
         InvalidClient: If the requesting client lacks 'subscriptions:read' scope.
     """
     subscriptions = await services.list_subscription(offset, limit)
-    return models.ListSubscriptionAPI(data=subscriptions)
+    return _conditional_response(
+        request, _render_list(_SUBSCRIPTION_LIST_ADAPTER, subscriptions), _CACHE_CONTROL_ENTITY
+    )
 
 
 @router.delete(
     "/{id}",
     status_code=status.HTTP_204_NO_CONTENT,
-    responses={404: {"model": models.GenericError}},
+    responses=_ERR_404,
     summary="Delete subscription",
 )
 async def delete_subscription(
@@ -131,7 +159,7 @@ async def delete_subscription(
     "/{id}/messages",
     response_model=models.ListMessageAPI,
     status_code=status.HTTP_200_OK,
-    responses={404: {"model": models.GenericError}},
+    responses=_ERR_404,
     summary="Get messages",
 )
 async def consume_messages(
@@ -152,28 +180,28 @@ async def consume_messages(
         batch_size: Number of messages to retrieve (1-100).
 
     Returns:
-        ListMessageAPI containing the available messages.
+        JSON response with the available messages under "data".
 
     Raises:
         NotFoundError: If no subscription with the given ID exists.
         InvalidClient: If the requesting client lacks 'subscriptions:consume' scope.
     """
-    subscription = await get_subscription(id, token)
     messages = await services.consume_messages(
-        subscription_id=subscription.id, consumer_id=consumer_id, batch_size=batch_size
+        subscription_id=id, consumer_id=consumer_id, batch_size=batch_size
     )
-    return models.ListMessageAPI(data=messages)
+    return _list_response(_MESSAGE_LIST_ADAPTER, messages)
 
 
 @router.post(
     "/{id}/acks",
     status_code=status.HTTP_204_NO_CONTENT,
-    responses={404: {"model": models.GenericError}},
+    openapi_extra=_MESSAGE_IDS_OPENAPI,
+    responses=_ERR_404,
     summary="Ack messages",
 )
 async def ack_messages(
     id: str,
-    data: list[UUID],
+    data: Annotated[list[str], Depends(_message_ids_body)],
     token: Annotated[models.DecodedClientToken, Depends(services.require_scope("subscriptions", "consume"))],
 ):
     """Acknowledge successful processing of messages.
@@ -190,19 +218,19 @@ async def ack_messages(
         NotFoundError: If no subscription with the given ID exists.
         InvalidClient: If the requesting client lacks 'subscriptions:consume' scope.
     """
-    subscription = await get_subscription(id, token)
-    await services.ack_messages(subscription_id=subscription.id, message_ids=data)
+    await services.ack_messages(subscription_id=id, message_ids=data)
 
 
 @router.post(
     "/{id}/nacks",
     status_code=status.HTTP_204_NO_CONTENT,
-    responses={404: {"model": models.GenericError}},
+    openapi_extra=_MESSAGE_IDS_OPENAPI,
+    responses=_ERR_404,
     summary="Nack messages",
 )
 async def nack_messages(
     id: str,
-    data: list[UUID],
+    data: Annotated[list[str], Depends(_message_ids_body)],
     token: Annotated[models.DecodedClientToken, Depends(services.require_scope("subscriptions", "consume"))],
 ):
     """Negative acknowledgment of message processing failure.
@@ -219,22 +247,21 @@ async def nack_messages(
         NotFoundError: If no subscription with the given ID exists.
         InvalidClient: If the requesting client lacks 'subscriptions:consume' scope.
     """
-    subscription = await get_subscription(id, token)
-    await services.nack_messages(subscription_id=subscription.id, message_ids=data)
+    await services.nack_messages(subscription_id=id, message_ids=data)
 
 
 @router.get(
     "/{id}/dlq",
     response_model=models.ListMessageAPI,
     status_code=status.HTTP_200_OK,
-    responses={404: {"model": models.GenericError}},
+    responses=_ERR_404,
     summary="List dlq messages",
 )
 async def list_dlq(
     id: str,
     token: Annotated[models.DecodedClientToken, Depends(services.require_scope("subscriptions", "consume"))],
-    offset: int = Query(default=0, ge=0),
-    limit: int = Query(default=10, ge=1, le=100),
+    offset: _Offset = 0,
+    limit: _Limit = 10,
 ):
     """List messages in the dead letter queue.
 
@@ -248,26 +275,26 @@ async def list_dlq(
         limit: Maximum number of items to return (1-100).
 
     Returns:
-        ListMessageAPI containing the DLQ messages.
+        JSON response with the DLQ messages under "data".
 
     Raises:
         NotFoundError: If no subscription with the given ID exists.
         InvalidClient: If the requesting client lacks 'subscriptions:consume' scope.
     """
-    subscription = await get_subscription(id, token)
-    messages = await services.list_dlq_messages(subscription_id=subscription.id, offset=offset, limit=limit)
-    return models.ListMessageAPI(data=messages)
+    messages = await services.list_dlq_messages(subscription_id=id, offset=offset, limit=limit)
+    return _list_response(_MESSAGE_LIST_ADAPTER, messages)
 
 
 @router.post(
     "/{id}/dlq/reprocess",
     status_code=status.HTTP_204_NO_CONTENT,
-    responses={404: {"model": models.GenericError}},
+    openapi_extra=_MESSAGE_IDS_OPENAPI,
+    responses=_ERR_404,
     summary="Reprocess dlq messages",
 )
 async def reprocess_dlq(
     id: str,
-    data: list[UUID],
+    data: Annotated[list[str], Depends(_message_ids_body)],
     token: Annotated[models.DecodedClientToken, Depends(services.require_scope("subscriptions", "consume"))],
 ):
     """Move dead letter queue messages back to active processing.
@@ -284,19 +311,19 @@ async def reprocess_dlq(
         NotFoundError: If no subscription with the given ID exists.
         InvalidClient: If the requesting client lacks 'subscriptions:consume' scope.
     """
-    subscription = await get_subscription(id, token)
-    await services.reprocess_dlq_messages(subscription_id=subscription.id, message_ids=data)
+    await services.reprocess_dlq_messages(subscription_id=id, message_ids=data)
 
 
 @router.get(
     "/{id}/metrics",
     response_model=models.SubscriptionMetrics,
     status_code=status.HTTP_200_OK,
-    responses={404: {"model": models.GenericError}},
+    responses=_ERR_404,
     summary="Get subscription metrics",
 )
 async def subscription_metrics(
     id: str,
+    request: Request,
     token: Annotated[models.DecodedClientToken, Depends(services.require_scope("subscriptions", "read"))],
 ):
     """Get metrics and statistics for a subscription.
@@ -308,11 +335,11 @@ async def subscription_metrics(
         token: Decoded client token with 'subscriptions:read' scope.
 
     Returns:
-        SubscriptionMetrics containing message counts by state.
+        JSON response with the message counts by state and an ETag, or 304 if unchanged.
 
     Raises:
         NotFoundError: If no subscription with the given ID exists.
         InvalidClient: If the requesting client lacks 'subscriptions:read' scope.
     """
-    subscription = await get_subscription(id, token)
-    return await services.subscription_metrics(subscription_id=subscription.id)
+    metrics = await services.subscription_metrics(subscription_id=id)
+    return _etag_response(request, metrics, _CACHE_CONTROL_METRICS)
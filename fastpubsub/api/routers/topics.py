@@ -2,18 +2,35 @@
 
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Request, status
 
 from fastpubsub import models, services
+from fastpubsub.api.helpers import (
+    _CACHE_CONTROL_ENTITY,
+    _conditional_response,
+    _ERR_404,
+    _ERR_409,
+    _etag_response,
+    _Limit,
+    _messages_body,
+    _MESSAGES_OPENAPI,
+    _Offset,
+    _render_list,
+    _TOPIC_LIST_ADAPTER,
+    FastORJSONResponse,
+    ORJSONRoute,
+)
 
-router = APIRouter(prefix="/topics", tags=["topics"])
+router = APIRouter(
+    prefix="/topics", tags=["topics"], default_response_class=FastORJSONResponse, route_class=ORJSONRoute
+)
 
 
 @router.post(
     "",
     response_model=models.Topic,
     status_code=status.HTTP_201_CREATED,
-    responses={409: {"model": models.GenericError}},
+    responses=_ERR_409,
     summary="Create a new topic",
 )
 async def create_topic(
@@ -30,24 +47,27 @@ async def create_topic(
         token: Decoded client token with 'topics:create' scope.
 
     Returns:
-        Topic model with the created topic details.
+        JSON response with the created topic details.
 
     Raises:
         AlreadyExistsError: If a topic with the same ID already exists.
         InvalidClient: If the requesting client lacks 'topics:create' scope.
     """
-    return await services.create_topic(data)
+    topic = await services.create_topic(data)
+    return FastORJSONResponse(topic, status_code=status.HTTP_201_CREATED)
 
 
 @router.get(
     "/{id}",
     response_model=models.Topic,
     status_code=status.HTTP_200_OK,
-    responses={404: {"model": models.GenericError}},
+    responses=_ERR_404,
     summary="Get a topic",
 )
 async def get_topic(
-    id: str, token: Annotated[models.DecodedClientToken, Depends(services.require_scope("topics", "read"))]
+    id: str,
+    request: Request,
+    token: Annotated[models.DecodedClientToken, Depends(services.require_scope("topics", "read"))],
 ):
     """Retrieve a topic by ID.
 
@@ -58,13 +78,14 @@ async def get_topic(
         token: Decoded client token with 'topics:read' scope.
 
     Returns:
-        Topic model with full topic details.
+        JSON response with the topic details and an ETag, or 304 if the client copy is current.
 
     Raises:
         NotFoundError: If no topic with the given ID exists.
         InvalidClient: If the requesting client lacks 'topics:read' scope.
     """
-    return await services.get_topic(id)
+    topic = await services.get_topic(id)
+    return _etag_response(request, topic, _CACHE_CONTROL_ENTITY)
 
 
 @router.get(
@@ -74,9 +95,10 @@ async def get_topic(
     summary="List topics",
 )
 async def list_topic(
+    request: Request,
     token: Annotated[models.DecodedClientToken, Depends(services.require_scope("topics", "read"))],
-    offset: int = Query(default=0, ge=0),
-    limit: int = Query(default=10, ge=1, le=100),
+    offset: _Offset = 0,
+    limit: _Limit = 10,
 ):
     """List topics with pagination support.
 
@@ -88,19 +110,19 @@ async def list_topic(
         limit: Maximum number of items to return (1-100).
 
     Returns:
-        ListTopicAPI containing the list of topics.
+        JSON response with the list of topics under "data" and an ETag, or 304 if unchanged.
 
     Raises:
         InvalidClient: If the requesting client lacks 'topics:read' scope.
     """
     topics = await services.list_topic(offset, limit)
-    return models.ListTopicAPI(data=topics)
+    return _conditional_response(request, _render_list(_TOPIC_LIST_ADAPTER, topics), _CACHE_CONTROL_ENTITY)
 
 
 @router.delete(
     "/{id}",
     status_code=status.HTTP_204_NO_CONTENT,
-    responses={404: {"model": models.GenericError}},
+    responses=_ERR_404,
     summary="Delete a topic",
 )
 async def delete_topic(
@@ -125,12 +147,13 @@ async def delete_topic(
 @router.post(
     "/{id}/messages",
     status_code=status.HTTP_204_NO_CONTENT,
-    responses={404: {"model": models.GenericError}},
+    openapi_extra=_MESSAGES_OPENAPI,
+    responses=_ERR_404,
     summary="Post messages",
 )
 async def publish_messages(
     id: str,
-    data: list[dict[str, Any]],
+    data: Annotated[list[dict[str, Any]], Depends(_messages_body)],
     token: Annotated[models.DecodedClientToken, Depends(services.require_scope("topics", "publish"))],
 ):
     """Publish messages to a topic.
@@ -150,5 +173,4 @@ async def publish_messages(
         NotFoundError: If no topic with the given ID exists.
         InvalidClient: If the requesting client lacks 'topics:publish' scope.
     """
-    topic = await services.get_topic(id)
-    return await services.publish_messages(topic_id=topic.id, messages=data)
+    return await services.publish_messages(topic_id=id, messages=data)
@@ -2,7 +2,7 @@
 
 from enum import StrEnum
 
-from pydantic import Field, field_validator, model_validator
+from pydantic import AliasChoices, Field, field_validator, model_validator
 from pydantic.networks import IPvAnyAddress
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -35,7 +35,9 @@ class Settings(BaseSettings):
     database_echo: bool = False
     database_pool_size: int = Field(default=5, ge=1)
     database_max_overflow: int = Field(default=10, ge=1)
-    database_pool_pre_ping: bool = True
+    database_pool_pre_ping: bool = False
+    database_pool_timeout_seconds: float = Field(default=30, gt=0)
+    database_pool_recycle_seconds: int = Field(default=1800, ge=-1)
 
     # log
     log_formatter: str = (
@@ -48,24 +50,38 @@ class Settings(BaseSettings):
     subscription_backoff_min_seconds: int = Field(default=5, ge=1)
     subscription_backoff_max_seconds: int = Field(default=300, ge=1)
 
+    # ack/nack batching
+    ack_batch_window_ms: int = Field(default=5, ge=0)
+    ack_batch_max_size: int = Field(default=500, ge=1)
+
+    # cache
+    cache_ttl_seconds: int = Field(default=30, ge=0)
+
     # api
     api_debug: bool = False
     api_host: IPvAnyAddress = Field(default="0.0.0.0")
     api_port: int = Field(default=8000, ge=1)
-    api_num_workers: int = Field(default=1, ge=1)
+    api_num_workers: int = Field(
+        default=1, ge=1, validation_alias=AliasChoices("fastpubsub_api_num_workers", "web_concurrency")
+    )
+    api_gzip_minimum_size: int = Field(default=1024, ge=0)
+    api_gzip_compresslevel: int = Field(default=1, ge=1, le=9)
+    api_metrics_enabled: bool = True
 
     # workers
     cleanup_acked_messages_older_than_seconds: int = Field(default=3600, ge=1)
     cleanup_stuck_messages_lock_timeout_seconds: int = Field(default=60, ge=1)
+    cleanup_batch_size: int = Field(default=10_000, ge=1)
 
     # auth
     auth_enabled: bool = False
     auth_secret_key: str | None = None
     auth_algorithm: str = "HS256"
     auth_access_token_expire_minutes: int = Field(default=30, ge=1)
+    auth_token_cache_ttl_seconds: int = Field(default=10, ge=0)
 
     # load .env
-    model_config = SettingsConfigDict(env_file=".env", env_prefix="fastpubsub_")
+    model_config = SettingsConfigDict(env_file=".env", env_prefix="fastpubsub_", populate_by_name=True)
 
     @field_validator("database_url")
     def validate_database_url_format(cls, v: str):
@@ -1,29 +1,77 @@
 """Database models and utilities for fastpubsub application."""
 
+import asyncio
+from collections.abc import Callable
+from functools import cache
+from operator import attrgetter
 from pathlib import Path
+from typing import Any
 
+import psycopg
 import sqlalchemy as sa
-from alembic.config import command, Config
+from psycopg.errors import ForeignKeyViolation, NoDataFound, UniqueViolation
 from sqlalchemy import inspect
 from sqlalchemy.dialects import postgresql
-from sqlalchemy.exc import IntegrityError
-from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession, create_async_engine
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.exc import DBAPIError, IntegrityError
+from sqlalchemy.ext.asyncio import (
+    async_sessionmaker,
+    AsyncConnection,
+    AsyncSession,
+    create_async_engine,
+)
+from sqlalchemy.orm import DeclarativeBase, Mapper
 
 from fastpubsub.config import settings
 from fastpubsub.logger import get_logger
 
 logger = get_logger(__name__)
+
+# libpq TCP keepalives detect connections silently dropped by the network without a per-checkout ping
+_CONNECT_ARGS = {
+    "keepalives": 1,
+    "keepalives_idle": 30,
+    "keepalives_interval": 10,
+    "keepalives_count": 3,
+    "tcp_user_timeout": 30_000,
+}
+
 engine = create_async_engine(
     settings.database_url,
     echo=settings.database_echo,
     pool_pre_ping=settings.database_pool_pre_ping,
     pool_size=settings.database_pool_size,
     max_overflow=settings.database_max_overflow,
+    pool_timeout=settings.database_pool_timeout_seconds,
+    pool_recycle=settings.database_pool_recycle_seconds,
+    # Reuse the most recently returned connection so a few stay hot and the surplus can idle out
+    pool_use_lifo=True,
+    connect_args=_CONNECT_ARGS,
 )
 SessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
+@cache
+def _column_getter(cls: type) -> tuple[tuple[str, ...], Callable[[Any], tuple[Any, ...]]]:
+    """Return the column keys of a mapped class and a getter for their values.
+
+    Column attributes are the same for every instance of a class, so the
+    mapper is only inspected once per class.
+
+    Args:
+        cls: The mapped class.
+
+    Returns:
+        Tuple of the column keys and a getter returning their values as a tuple.
+    """
+    mapper: Mapper[Any] = inspect(cls)
+    keys = tuple(column.key for column in mapper.column_attrs)
+    if len(keys) == 1:
+        # attrgetter with a single attribute returns the bare value instead of a tuple
+        key = keys[0]
+        return keys, lambda obj: (getattr(obj, key),)
+    return keys, attrgetter(*keys)
+
+
 class Base(DeclarativeBase):
     """Base declarative class for all database models.
 
@@ -36,7 +84,8 @@ class Base(DeclarativeBase):
         Returns:
             Dictionary mapping column names to their values.
         """
-        return {c.key: getattr(self, c.key) for c in inspect(self).mapper.column_attrs}
+        keys, getter = _column_getter(type(self))
+        return dict(zip(keys, getter(self), strict=True))
 
 
 class Topic(Base):
@@ -119,6 +168,68 @@ class Client(Base):
         return f"Client(id={self.id}, name={self.name})"
 
 
+async def warm_up_pool() -> None:
+    """Open the pooled database connections ahead of the first requests.
+
+    Checks out pool_size connections at once and returns them to the pool, so
+    requests don't pay for the connection handshake. Failures are logged and
+    ignored; the readiness probe reports database problems. Connections that
+    did open are still returned to the pool when others fail.
+    """
+    results = await asyncio.gather(
+        *(engine.connect().start() for _ in range(settings.database_pool_size)), return_exceptions=True
+    )
+    connections = [result for result in results if isinstance(result, AsyncConnection)]
+    await asyncio.gather(*(connection.close() for connection in connections))
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if errors:
+        logger.warning(
+            "database pool warm up failed",
+            extra={"error": str(errors[0]), "failed_connections": len(errors)},
+        )
+        return
+    logger.info("database pool warmed up", extra={"pool_size": settings.database_pool_size})
+
+
+_MIGRATIONS_PATH = Path(__file__).parents[1].joinpath("migrations")
+
+
+def _head_revision() -> str:
+    """Return the latest migration revision without loading Alembic.
+
+    Migration files are named "<sequence>_<revision>_<slug>.py", so the head
+    is the revision of the file with the highest sequence number.
+
+    Returns:
+        The head revision id.
+    """
+    latest = max(
+        _MIGRATIONS_PATH.joinpath("versions").glob("[0-9]*_*.py"),
+        key=lambda path: int(path.name.split("_")[0]),
+    )
+    return latest.name.split("_")[1]
+
+
+async def _current_revision() -> str | None:
+    """Return the revision the database schema is currently at.
+
+    Returns:
+        The revision stored in the alembic_version table, or None if the
+        database hasn't been migrated yet.
+    """
+    conninfo = (
+        sa.make_url(settings.database_url).set(drivername="postgresql").render_as_string(hide_password=False)
+    )
+    async with await psycopg.AsyncConnection.connect(conninfo) as conn:
+        cursor = await conn.execute("SELECT to_regclass('alembic_version') IS NOT NULL")
+        row = await cursor.fetchone()
+        if not row or not row[0]:
+            return None
+        cursor = await conn.execute("SELECT version_num FROM alembic_version")
+        row = await cursor.fetchone()
+        return row[0] if row else None
+
+
 async def run_migrations(command_type: str = "upgrade", revision: str = "head") -> None:
     """Run database migrations using Alembic.
 
@@ -131,9 +242,16 @@ async def run_migrations(command_type: str = "upgrade", revision: str = "head")
     Raises:
         Exception: If migration command fails.
     """
-    parent_path = Path(__file__).parents[1]
-    script_location = parent_path.joinpath(Path("migrations"))
-    ini_location = parent_path.joinpath(Path("alembic.ini"))
+    # Upgrading to head is run on every deploy, skip loading Alembic when there is nothing to apply
+    if command_type == "upgrade" and revision == "head" and await _current_revision() == _head_revision():
+        logger.info("database already at head revision", extra={"revision": _head_revision()})
+        return
+
+    # Alembic is only needed by the db-migrate command, importing it eagerly would slow down every startup
+    from alembic.config import command, Config
+
+    script_location = _MIGRATIONS_PATH
+    ini_location = _MIGRATIONS_PATH.parent.joinpath("alembic.ini")
     logger.info(
         "running db migrations",
         extra=dict(ini_location=ini_location, script_location=script_location),
@@ -165,7 +283,7 @@ def is_unique_violation(exc: IntegrityError) -> bool:
     Returns:
         True if the exception is a unique constraint violation, False otherwise.
     """
-    return "psycopg.errors.UniqueViolation" in exc.args[0]
+    return isinstance(exc.orig, UniqueViolation)
 
 
 def is_foreign_key_violation(exc: IntegrityError) -> bool:
@@ -177,4 +295,16 @@ def is_foreign_key_violation(exc: IntegrityError) -> bool:
     Returns:
         True if the exception is a foreign key constraint violation, False otherwise.
     """
-    return "psycopg.errors.ForeignKeyViolation" in exc.args[0]
+    return isinstance(exc.orig, ForeignKeyViolation)
+
+
+def is_no_data_found(exc: DBAPIError) -> bool:
+    """Check if a DBAPIError was raised by a stored procedure for a missing entity.
+
+    Args:
+        exc: The DBAPIError exception to check.
+
+    Returns:
+        True if the exception is a no_data_found error, False otherwise.
+    """
+    return isinstance(exc.orig, NoDataFound)
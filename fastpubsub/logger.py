@@ -1,12 +1,46 @@
 """Logging utilities for fastpubsub application."""
 
+import atexit
+import copy
 import logging
+import queue
+from contextvars import ContextVar
+from functools import cache
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any
 
-from pythonjsonlogger.json import JsonFormatter
+from pythonjsonlogger.orjson import OrjsonFormatter
 
 from fastpubsub.config import settings
 
+# Details of the HTTP request being handled, set by the request logging middleware
+request_context: ContextVar[dict[str, Any] | None] = ContextVar("request_context", default=None)
 
+
+class RequestContextFilter(logging.Filter):
+    """Logging filter that adds the current request context to log records.
+
+    Keys already present on the record (for example, passed through extra)
+    are not overwritten.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Merge the current request context into the log record.
+
+        Args:
+            record: The log record being emitted.
+
+        Returns:
+            Always True, the record is never dropped.
+        """
+        context = request_context.get()
+        if context:
+            for key, value in context.items():
+                record.__dict__.setdefault(key, value)
+        return True
+
+
+@cache
 def get_log_level(level: str) -> int:
     """Convert string log level to logging module constant.
 
@@ -25,18 +59,69 @@ def get_log_level(level: str) -> int:
 def get_console_handler() -> logging.StreamHandler:
     """Create and configure a console handler with JSON formatter.
 
+    Records are encoded with orjson rather than the standard json module.
+
     Returns:
         Configured StreamHandler with JSON formatter for console output.
     """
-    formatter = JsonFormatter(settings.log_formatter)
+    formatter = OrjsonFormatter(settings.log_formatter)
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
     return console_handler
 
 
+class _RecordQueueHandler(QueueHandler):
+    """QueueHandler that leaves formatting of exception info to the console handler.
+
+    The stock QueueHandler merges the traceback into the message, which would
+    replace the exc_info field of the JSON output.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Prepare a record for queuing.
+
+        Args:
+            record: The log record being emitted.
+
+        Returns:
+            A copy of the record with the message already merged with its arguments.
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+# Records are handed over to a background thread that formats and writes them,
+# so JSON formatting and stream I/O stay off the event loop
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+
+@cache
+def get_queue_handler() -> QueueHandler:
+    """Return the handler that enqueues records for the background console writer.
+
+    The handler is shared by every logger. The queue listener is started the
+    first time it is built. The request context is added to records here, in
+    the thread that emits them.
+
+    Returns:
+        Configured QueueHandler feeding the shared log queue.
+    """
+    queue_listener = QueueListener(_log_queue, get_console_handler())
+    queue_listener.start()
+    atexit.register(queue_listener.stop)
+
+    queue_handler = _RecordQueueHandler(_log_queue)
+    queue_handler.addFilter(RequestContextFilter())
+    return queue_handler
+
+
 def get_logger(name: str) -> logging.Logger:
     """Create and configure a logger with the specified name.
 
+    Calling it again for the same name doesn't add another handler.
+
     Args:
         name: Name for the logger, typically __name__ from the calling module.
 
@@ -44,9 +129,9 @@ def get_logger(name: str) -> logging.Logger:
         Configured logger instance with appropriate log level and handlers.
     """
     logger = logging.getLogger(name)
-    log_level = get_log_level(settings.log_level)
-    logger.setLevel(log_level)
-    logger.addHandler(get_console_handler())
+    logger.setLevel(get_log_level(settings.log_level))
+    if not logger.handlers:
+        logger.addHandler(get_queue_handler())
     # with this pattern, it's rarely necessary to propagate the error up to parent
     logger.propagate = False
     return logger
@@ -1,20 +1,38 @@
-"""Command-line interface for fastpubsub application."""
+"""Command-line interface for fastpubsub application.
 
+Commands import the modules they need when they run, so each invocation
+only loads the code of its own command.
+"""
+
+import argparse
 import asyncio
-from typing import Annotated
+from collections.abc import Callable, Coroutine, Sequence
+from typing import Any
 
-import typer
+import uvloop
 
-from fastpubsub.api import app, run_server
 from fastpubsub.config import settings
-from fastpubsub.database import run_migrations
 from fastpubsub.logger import get_logger
-from fastpubsub.models import CreateClient
-from fastpubsub.services import cleanup_acked_messages, cleanup_stuck_messages, create_client
-from fastpubsub.services.clients import generate_secret
 
 logger = get_logger(__name__)
-cli = typer.Typer()
+
+# Spellings accepted for boolean arguments
+_TRUE_VALUES = frozenset(("1", "true", "t", "yes", "y", "on"))
+_FALSE_VALUES = frozenset(("0", "false", "f", "no", "n", "off"))
+
+
+def _run(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine to completion on a uvloop event loop.
+
+    Uses the same event loop implementation as the server.
+
+    Args:
+        coro: Coroutine to run.
+
+    Returns:
+        The result of the coroutine.
+    """
+    return asyncio.run(coro, loop_factory=uvloop.new_event_loop)
 
 
 async def _log_command_execution_async(command_name: str, func, *args, **kwargs):
@@ -35,19 +53,17 @@ async def _log_command_execution_async(command_name: str, func, *args, **kwargs)
     return result
 
 
-@cli.command("db-migrate")
 def run_migrations_command() -> None:
     """Run database migrations to upgrade to the latest schema.
 
     Executes all pending Alembic migrations to update the database schema
     to the latest version. This is typically used during application deployment.
     """
-    asyncio.run(
-        _log_command_execution_async("db-migrate", run_migrations, command_type="upgrade", revision="head")
-    )
+    from fastpubsub.database import run_migrations
+
+    _run(_log_command_execution_async("db-migrate", run_migrations, command_type="upgrade", revision="head"))
 
 
-@cli.command("server")
 def run_server_command() -> None:
     """Start the FastAPI server.
 
@@ -56,10 +72,11 @@ def run_server_command() -> None:
     """
     # Server is a long-running command, so we only log the start
     logger.info("Starting server command")
-    run_server(app)
+    from fastpubsub.api import run_server
+
+    run_server()
 
 
-@cli.command("cleanup_acked_messages")
 def run_cleanup_acked_messages() -> None:
     """Remove acknowledged messages older than the configured threshold.
 
@@ -67,7 +84,9 @@ def run_cleanup_acked_messages() -> None:
     and are older than the configured time threshold. Helps prevent database
     bloat and improve performance.
     """
-    asyncio.run(
+    from fastpubsub.services.messages import cleanup_acked_messages
+
+    _run(
         _log_command_execution_async(
             "cleanup_acked_messages",
             cleanup_acked_messages,
@@ -76,7 +95,6 @@ def run_cleanup_acked_messages() -> None:
     )
 
 
-@cli.command("cleanup_stuck_messages")
 def run_cleanup_stuck_messages() -> None:
     """Unlock messages that have been locked for too long.
 
@@ -84,7 +102,9 @@ def run_cleanup_stuck_messages() -> None:
     making them available for consumption again. This helps recover from
     consumer failures or crashes.
     """
-    asyncio.run(
+    from fastpubsub.services.messages import cleanup_stuck_messages
+
+    _run(
         _log_command_execution_async(
             "cleanup_stuck_messages",
             cleanup_stuck_messages,
@@ -93,23 +113,19 @@ def run_cleanup_stuck_messages() -> None:
     )
 
 
-@cli.command("generate_secret_key")
 def run_generate_secret_key() -> None:
     """Generate a new random secret key for client authentication.
 
     Creates a cryptographically secure random string that can be used as
     a client secret for JWT token generation and validation.
     """
+    from fastpubsub.services.clients import generate_secret
+
     secret = generate_secret()
-    typer.echo(f"new_secret={secret}")
+    print(f"new_secret={secret}")
 
 
-@cli.command("create_client")
-def run_create_client(
-    name: Annotated[str, typer.Argument(help="The client name.")],
-    scopes: Annotated[str, typer.Argument(help="The client scopes.")] = "*",
-    is_active: Annotated[bool, typer.Argument(help="The flag to enable or disable client.")] = True,
-) -> None:
+def run_create_client(name: str, scopes: str = "*", is_active: bool = True) -> None:
     """Create a new client with the specified name and scopes.
 
     Creates a new authorized client in the system that can access the
@@ -120,11 +136,85 @@ def run_create_client(
         scopes: Space-separated list of permissions/scopes granted to the client.
         is_active: Whether the client is initially active and can authenticate.
     """
-    client_result = asyncio.run(
-        create_client(data=CreateClient(name=name, scopes=scopes, is_active=is_active))
+    from fastpubsub.models import CreateClient
+    from fastpubsub.services.clients import create_client
+
+    client_result = _run(create_client(data=CreateClient(name=name, scopes=scopes, is_active=is_active)))
+    print(f"client_id={client_result.id}")
+    print(f"client_secret={client_result.secret}")
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean command-line argument.
+
+    Args:
+        value: Argument value, such as "true", "false", "1" or "0".
+
+    Returns:
+        The parsed boolean.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a recognized boolean.
+    """
+    normalized = value.strip().lower()
+    if normalized in _TRUE_VALUES:
+        return True
+    if normalized in _FALSE_VALUES:
+        return False
+    raise argparse.ArgumentTypeError(f"{value!r} is not a valid boolean")
+
+
+def _add_command(subparsers: Any, name: str, func: Callable[..., None]) -> argparse.ArgumentParser:
+    """Register a command, using the first line of its docstring as help.
+
+    Args:
+        subparsers: Subparsers action of the main parser.
+        name: Command name.
+        func: Function run for the command, called with the parsed arguments.
+
+    Returns:
+        The parser of the command, to add its arguments.
+    """
+    summary = (func.__doc__ or "").strip().partition("\n")[0] or None
+    parser = subparsers.add_parser(name, help=summary, description=summary)
+    parser.set_defaults(func=func)
+    return parser
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser.
+
+    Returns:
+        Parser with one subcommand per CLI command.
+    """
+    parser = argparse.ArgumentParser(prog="fastpubsub", description=__doc__)
+    subparsers = parser.add_subparsers(title="commands", dest="command", metavar="command", required=True)
+
+    _add_command(subparsers, "db-migrate", run_migrations_command)
+    _add_command(subparsers, "server", run_server_command)
+    _add_command(subparsers, "cleanup_acked_messages", run_cleanup_acked_messages)
+    _add_command(subparsers, "cleanup_stuck_messages", run_cleanup_stuck_messages)
+    _add_command(subparsers, "generate_secret_key", run_generate_secret_key)
+    create_client_parser = _add_command(subparsers, "create_client", run_create_client)
+    create_client_parser.add_argument("name", help="The client name.")
+    create_client_parser.add_argument("scopes", nargs="?", default="*", help="The client scopes.")
+    create_client_parser.add_argument(
+        "is_active", nargs="?", default=True, type=_parse_bool, help="The flag to enable or disable client."
     )
-    typer.echo(f"client_id={client_result.id}")
-    typer.echo(f"client_secret={client_result.secret}")
+
+    return parser
+
+
+def cli(argv: Sequence[str] | None = None) -> None:
+    """Parse the command line and run the selected command.
+
+    Args:
+        argv: Command-line arguments, defaults to sys.argv[1:].
+    """
+    args = vars(_build_parser().parse_args(argv))
+    func = args.pop("func")
+    del args["command"]
+    func(**args)
 
 
 if __name__ == "__main__":
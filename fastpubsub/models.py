@@ -11,6 +11,25 @@ from fastpubsub.sanitizer import sanitize_filter
 
 regex_for_id = "^[a-zA-Z0-9-._]+$"
 
+# Scopes a client can be granted, resource scopes may also be narrowed to an id ("topics:read:my-topic")
+_VALID_SCOPES = frozenset(
+    (
+        "*",
+        "topics:create",
+        "topics:read",
+        "topics:delete",
+        "topics:publish",
+        "subscriptions:create",
+        "subscriptions:read",
+        "subscriptions:delete",
+        "subscriptions:consume",
+        "clients:create",
+        "clients:update",
+        "clients:read",
+        "clients:delete",
+    )
+)
+
 
 class GenericError(BaseModel):
     """Generic error response model.
@@ -211,26 +230,9 @@ class CreateClient(BaseModel):
         Raises:
             ValueError: If any scope is invalid.
         """
-        valid_scopes = (
-            "*",
-            "topics:create",
-            "topics:read",
-            "topics:delete",
-            "topics:publish",
-            "subscriptions:create",
-            "subscriptions:read",
-            "subscriptions:delete",
-            "subscriptions:consume",
-            "clients:create",
-            "clients:update",
-            "clients:read",
-            "clients:delete",
-        )
         for scope in v.split():
-            base_scope = scope
-            if len(scope.split(":")) == 3:
-                base_scope = scope.rsplit(":", 1)[0]
-            if base_scope not in valid_scopes:
+            base_scope = scope.rsplit(":", 1)[0] if scope.count(":") == 2 else scope
+            if base_scope not in _VALID_SCOPES:
                 raise ValueError(f"Invalid scope {scope}")
         return v
 
@@ -3,6 +3,19 @@
 import html
 import re
 
+# Control characters except tab, newline and carriage return
+_CONTROL_CHARS_RE = re.compile(r"[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]")
+# Characters replaced by html.escape(quote=True)
+_HTML_SPECIAL_CHARS_RE = re.compile(r"[&<>\"']")
+
+_INVALID_FILTER_MESSAGE = (
+    "Invalid filter structure. Expected format: "
+    '{"field_name": ["value1", "value2"]} where values are strings, numbers, or booleans'
+)
+
+# Types allowed as filter values; None/null is not one of them
+_FILTER_VALUE_TYPES = (str, int, float, bool)
+
 
 def sanitize_string(value: str) -> str:
     """Sanitize a string value to prevent XSS attacks.
@@ -22,14 +35,28 @@ def sanitize_string(value: str) -> str:
 
     # Remove null bytes and other control characters (except newlines, tabs)
     # Control characters can be used in injection attacks
-    value = re.sub(r"[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]", "", value)
+    value = _CONTROL_CHARS_RE.sub("", value)
 
-    # HTML entity encode to prevent XSS
-    value = html.escape(value, quote=True)
+    # HTML entity encode to prevent XSS, most values have nothing to escape
+    if _HTML_SPECIAL_CHARS_RE.search(value):
+        value = html.escape(value, quote=True)
 
     return value
 
 
+def _is_valid_filter_field(key: object, values: object) -> bool:
+    """Check that a filter field maps a string key to an array of values.
+
+    Args:
+        key: Filter field name.
+        values: Filter field values.
+
+    Returns:
+        True if the field has the expected structure, False otherwise.
+    """
+    return isinstance(key, str) and isinstance(values, list)
+
+
 def validate_filter_structure(filter_dict: dict | None) -> bool:
     """Validate that a filter has the correct structure.
 
@@ -50,33 +77,19 @@ def validate_filter_structure(filter_dict: dict | None) -> bool:
     if not isinstance(filter_dict, dict):
         return False
 
-    for key, value in filter_dict.items():
-        # Keys must be strings
-        if not isinstance(key, str):
-            return False
-
-        # Values must be lists/arrays
-        if not isinstance(value, list):
-            return False
-
-        # Array elements must be primitives (string, int, float, bool)
-        for item in value:
-            if not isinstance(item, (str, int, float, bool)):
-                return False
-            # Disallow None/null in arrays
-            if item is None:
-                return False
-
-    return True
+    return all(
+        _is_valid_filter_field(key, values)
+        and all(isinstance(value, _FILTER_VALUE_TYPES) for value in values)
+        for key, values in filter_dict.items()
+    )
 
 
 def sanitize_filter(filter_dict: dict | None) -> dict | None:
     """Sanitize a filter dictionary to prevent SQL and XSS injection attacks.
 
-    This function:
-    1. Validates the filter structure
-    2. Sanitizes all string keys and values
-    3. Ensures no malicious content can be injected
+    The structure is checked with the same rules as validate_filter_structure
+    while the keys and string values are sanitized, in a single pass over the
+    filter.
 
     Args:
         filter_dict: Filter dictionary to sanitize
@@ -90,28 +103,21 @@ def sanitize_filter(filter_dict: dict | None) -> dict | None:
     if filter_dict is None or filter_dict == {}:
         return filter_dict
 
-    # Validate structure first
-    if not validate_filter_structure(filter_dict):
-        raise ValueError(
-            "Invalid filter structure. Expected format: "
-            '{"field_name": ["value1", "value2"]} where values are strings, numbers, or booleans'
-        )
+    if not isinstance(filter_dict, dict):
+        raise ValueError(_INVALID_FILTER_MESSAGE)
 
-    # Sanitize all keys and values
     sanitized = {}
     for key, values in filter_dict.items():
-        # Sanitize key (field name)
-        sanitized_key = sanitize_string(key)
+        if not _is_valid_filter_field(key, values):
+            raise ValueError(_INVALID_FILTER_MESSAGE)
 
-        # Sanitize each value in the array
-        sanitized_values = []
+        sanitized_values: list[str | int | float | bool] = []
         for value in values:
-            if isinstance(value, str):
-                sanitized_values.append(sanitize_string(value))
-            else:
-                # Numbers and booleans don't need sanitization
-                sanitized_values.append(value)
+            if not isinstance(value, _FILTER_VALUE_TYPES):
+                raise ValueError(_INVALID_FILTER_MESSAGE)
+            # Numbers and booleans don't need sanitization
+            sanitized_values.append(sanitize_string(value) if isinstance(value, str) else value)
 
-        sanitized[sanitized_key] = sanitized_values
+        sanitized[sanitize_string(key)] = sanitized_values
 
     return sanitized
@@ -1,6 +1,8 @@
 """Authentication and authorization services for fastpubsub."""
 
+import logging
 import time
+from functools import lru_cache
 from typing import Annotated
 
 from fastapi import Depends, Request
@@ -17,6 +19,23 @@ logger = get_logger(__name__)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/oauth/token", auto_error=False)
 
 
+def _has_base_scope(token_scopes: set[str], base_scope: str, resource_id: str | None) -> bool:
+    """Check if token scopes grant a "resource:action" scope.
+
+    Args:
+        token_scopes: Set of scopes from the client's token.
+        base_scope: Required scope in the "resource:action" form.
+        resource_id: Optional specific resource ID for fine-grained permissions.
+
+    Returns:
+        True if the required scope is granted, False otherwise.
+    """
+    if "*" in token_scopes or base_scope in token_scopes:
+        return True
+
+    return bool(resource_id) and f"{base_scope}:{resource_id}" in token_scopes
+
+
 def has_scope(token_scopes: set[str], resource: str, action: str, resource_id: str | None = None) -> bool:
     """Check if token scopes include the required permission.
 
@@ -32,18 +51,7 @@ def has_scope(token_scopes: set[str], resource: str, action: str, resource_id: s
     Returns:
         True if the required scope is granted, False otherwise.
     """
-    if "*" in token_scopes:
-        return True
-
-    base = f"{resource}:{action}"
-
-    if base in token_scopes:
-        return True
-
-    if resource_id and f"{base}:{resource_id}" in token_scopes:
-        return True
-
-    return False
+    return _has_base_scope(token_scopes, f"{resource}:{action}", resource_id)
 
 
 async def get_current_token(token: str | None = Depends(oauth2_scheme)) -> DecodedClientToken:
@@ -66,15 +74,17 @@ async def get_current_token(token: str | None = Depends(oauth2_scheme)) -> Decod
 
         decoded_token = await services.decode_jwt_client_token(token, auth_enabled=settings.auth_enabled)
 
-        duration = time.perf_counter() - start_time
-        logger.debug(
-            "token validated",
-            extra={
-                "client_id": str(decoded_token.client_id),
-                "scopes": list(decoded_token.scopes),
-                "duration": f"{duration:.4f}s",
-            },
-        )
+        # Runs on every authenticated request, so the extra fields are only built when they are logged
+        if logger.isEnabledFor(logging.DEBUG):
+            duration = time.perf_counter() - start_time
+            logger.debug(
+                "token validated",
+                extra={
+                    "client_id": str(decoded_token.client_id),
+                    "scopes": list(decoded_token.scopes),
+                    "duration": f"{duration:.4f}s",
+                },
+            )
         return decoded_token
     except InvalidClientToken as e:
         duration = time.perf_counter() - start_time
@@ -100,11 +110,13 @@ async def get_current_token(token: str | None = Depends(oauth2_scheme)) -> Decod
         raise
 
 
+@lru_cache(maxsize=64)
 def require_scope(resource: str, action: str):
     """Create a dependency that requires specific scope for API endpoints.
 
     Generates a FastAPI dependency that validates the incoming request
-    has the required scope for the specified resource and action.
+    has the required scope for the specified resource and action. The factory
+    is memoized, so endpoints requiring the same scope share one dependency.
 
     Args:
         resource: Resource type (e.g., 'topics', 'subscriptions', 'clients').
@@ -117,12 +129,11 @@ def require_scope(resource: str, action: str):
         InvalidClientToken: If client lacks required scope.
     """
 
-    async def dependency(request: Request, token: Annotated[DecodedClientToken, Depends(get_current_token)]):
-        resource_id = request.path_params.get("id")
-        if resource_id is not None:
-            resource_id = str(resource_id)
+    # Built once per (resource, action) instead of on every request
+    base_scope = f"{resource}:{action}"
 
-        if not has_scope(token.scopes, resource, action, resource_id):
+    async def dependency(request: Request, token: Annotated[DecodedClientToken, Depends(get_current_token)]):
+        if not _has_base_scope(token.scopes, base_scope, request.path_params.get("id")):
             raise InvalidClientToken("Insufficient scope") from None
 
         return token
@@ -23,10 +23,21 @@ from fastpubsub.models import (
     DecodedClientToken,
     UpdateClient,
 )
-from fastpubsub.services.helpers import _delete_entity, _get_entity, utc_now
+from fastpubsub.services.helpers import _delete_entity, _get_entity, _TTLCache, utc_now
 
 password_hash = PasswordHash.recommended()
 logger = get_logger(__name__)
+# Validated tokens, keyed by the raw token string, with their expiration timestamp
+_token_cache = _TTLCache(settings.auth_token_cache_ttl_seconds)
+
+
+def _forget_client_tokens(client_id: uuid.UUID) -> None:
+    """Remove the cached tokens of a client from this worker's token cache.
+
+    Args:
+        client_id: UUID of the client.
+    """
+    _token_cache.delete_if(lambda cached: cached[1].client_id == client_id)
 
 
 def generate_secret() -> str:
@@ -162,6 +173,7 @@ async def update_client(client_id: uuid.UUID, data: UpdateClient) -> Client:
         db_client.updated_at = utc_now()
 
         await session.commit()
+    _forget_client_tokens(client_id)
 
     return Client(**db_client.to_dict())
 
@@ -177,8 +189,11 @@ async def delete_client(client_id: uuid.UUID) -> None:
     Raises:
         NotFoundError: If no client with the given ID exists.
     """
-    async with SessionLocal() as session:
-        await _delete_entity(session, DBClient, client_id, "Client not found")
+    try:
+        async with SessionLocal() as session:
+            await _delete_entity(session, DBClient, client_id, "Client not found")
+    finally:
+        _forget_client_tokens(client_id)
 
 
 async def issue_jwt_client_token(client_id: uuid.UUID, client_secret: str) -> ClientToken:
@@ -262,8 +277,12 @@ async def issue_jwt_client_token(client_id: uuid.UUID, client_secret: str) -> Cl
 async def decode_jwt_client_token(access_token: str, auth_enabled: bool = True) -> DecodedClientToken:
     """Decode and validate a JWT access token.
 
-    Validates the token signature, expiration, and client status.
-    Ensures the token hasn't been revoked by checking token version.
+    Validates the token signature, expiration, and client status, and checks
+    the token version to detect revoked tokens. Validated tokens are cached for
+    auth_token_cache_ttl_seconds, or until they expire if sooner, and cache hits
+    skip the client lookup, so revocation is eventual. Updating or deleting a
+    client drops its cached tokens in the current worker only; other workers
+    keep accepting them until their cache entry expires.
 
     Args:
         access_token: JWT access token to decode and validate.
@@ -279,6 +298,13 @@ async def decode_jwt_client_token(access_token: str, auth_enabled: bool = True)
         logger.debug("authentication disabled, returning test token")
         return DecodedClientToken(client_id=uuid.uuid7(), scopes={"*"})
 
+    cached = _token_cache.get(access_token)
+    if cached is not None:
+        expires_at, decoded_token = cached
+        if expires_at > time.time():
+            return decoded_token
+        _token_cache.delete(access_token)
+
     start_time = time.perf_counter()
     logger.debug("decoding jwt token")
 
@@ -334,7 +360,9 @@ async def decode_jwt_client_token(access_token: str, auth_enabled: bool = True)
                 "duration": f"{duration:.4f}s",
             },
         )
-        return DecodedClientToken(client_id=uuid.UUID(client_id), scopes={scope for scope in scopes.split()})
+        decoded_token = DecodedClientToken(client_id=uuid.UUID(client_id), scopes=set(scopes.split()))
+        _token_cache.set(access_token, (payload.get("exp", 0), decoded_token))
+        return decoded_token
     except Exception as e:
         duration = time.perf_counter() - start_time
         logger.error(
@@ -1,12 +1,19 @@
 """Helper functions for service layer operations."""
 
+import asyncio
 import datetime
+import logging
 import time
 import uuid
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Iterator
+from contextlib import contextmanager
+from typing import Any
 
 from sqlalchemy import select, text
+from sqlalchemy.exc import DBAPIError
 
-from fastpubsub.database import SessionLocal
+from fastpubsub.database import is_no_data_found, SessionLocal
 from fastpubsub.exceptions import NotFoundError
 from fastpubsub.logger import get_logger
 
@@ -65,6 +72,24 @@ async def _delete_entity(session, model, entity_id: str | uuid.UUID, error_messa
     await session.commit()
 
 
+@contextmanager
+def _raise_not_found_on_no_data(error_message: str) -> Iterator[None]:
+    """Translate no_data_found errors raised by stored procedures into NotFoundError.
+
+    Args:
+        error_message: Error message to include in NotFoundError.
+
+    Raises:
+        NotFoundError: If the wrapped block raised a no_data_found error.
+    """
+    try:
+        yield
+    except DBAPIError as exc:
+        if is_no_data_found(exc):
+            raise NotFoundError(error_message) from None
+        raise
+
+
 async def _execute_sql_command(query: str, params: dict) -> bool:
     """Generic helper to execute SQL commands.
 
@@ -101,7 +126,7 @@ async def _execute_sql_command(query: str, params: dict) -> bool:
                     "duration": f"{duration:.4f}s",
                 },
             )
-        elif duration > 0.01:  # Log operations >10ms at debug level
+        elif duration > 0.01 and logger.isEnabledFor(logging.DEBUG):  # Log operations >10ms at debug level
             logger.debug(
                 "database operation completed",
                 extra={
@@ -124,3 +149,175 @@ async def _execute_sql_command(query: str, params: dict) -> bool:
             },
         )
         raise
+
+
+class _Batch:
+    """Items collected by _Coalescer for a single key, waiting to be flushed."""
+
+    __slots__ = ("items", "future", "handle")
+
+    def __init__(self, future: asyncio.Future) -> None:
+        self.items: list = []
+        self.future = future
+        self.handle: asyncio.TimerHandle | None = None
+
+
+class _Coalescer:
+    """Merge concurrent calls sharing the same key into a single batched call.
+
+    The first call for a key opens a batch and schedules its flush after the
+    window; calls arriving meanwhile append their items to it. The batch is
+    flushed earlier once it reaches max_size. Every caller gets the result (or
+    the exception) of the batched call, so the flush function must be safe to
+    apply to the merged items at once.
+    """
+
+    def __init__(self, flush: Callable[[str, list], Awaitable[bool]], window_ms: int, max_size: int) -> None:
+        """Initialize the coalescer.
+
+        Args:
+            flush: Async function called with the key and the merged items.
+            window_ms: How long to collect items before flushing; 0 disables batching.
+            max_size: Number of items that triggers an immediate flush.
+        """
+        self._flush = flush
+        self._window = window_ms / 1000
+        self._max_size = max_size
+        self._pending: dict[tuple[asyncio.AbstractEventLoop, str], _Batch] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def submit(self, key: str, items: list) -> bool:
+        """Add items to the batch for the key and wait for it to be flushed.
+
+        Args:
+            key: Key identifying which calls can be merged.
+            items: Items to add to the batch.
+
+        Returns:
+            The result of the batched flush call.
+        """
+        if self._window <= 0:
+            return await self._flush(key, items)
+
+        loop = asyncio.get_running_loop()
+        pending_key = (loop, key)
+        batch = self._pending.get(pending_key)
+        if batch is None:
+            batch = _Batch(loop.create_future())
+            batch.handle = loop.call_later(self._window, self._start_flush, pending_key, batch)
+            self._pending[pending_key] = batch
+
+        batch.items.extend(items)
+        if len(batch.items) >= self._max_size:
+            if batch.handle is not None:
+                batch.handle.cancel()
+            self._start_flush(pending_key, batch)
+
+        # a cancelled caller must not cancel the flush shared with the other callers
+        return await asyncio.shield(batch.future)
+
+    def _start_flush(self, pending_key: tuple[asyncio.AbstractEventLoop, str], batch: _Batch) -> None:
+        """Close the batch and run its flush in a background task.
+
+        Args:
+            pending_key: Event loop and key of the batch.
+            batch: Batch to flush.
+        """
+        if self._pending.get(pending_key) is batch:
+            del self._pending[pending_key]
+        task = pending_key[0].create_task(self._run_flush(pending_key[1], batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_flush(self, key: str, batch: _Batch) -> None:
+        """Flush the batch and publish the outcome to the waiting callers.
+
+        Args:
+            key: Key of the batch.
+            batch: Batch to flush.
+        """
+        try:
+            result = await self._flush(key, batch.items)
+        except Exception as exc:
+            batch.future.set_exception(exc)
+            # avoid "exception was never retrieved" warnings when every caller went away
+            batch.future.exception()
+        else:
+            batch.future.set_result(result)
+        finally:
+            # a cancelled flush must not leave the callers waiting on the future forever
+            if not batch.future.done():
+                batch.future.cancel()
+
+
+class _TTLCache:
+    """Small in-process LRU cache whose entries expire after a fixed TTL.
+
+    Entries are local to the worker process, so other workers may keep
+    serving a deleted entity until its TTL expires.
+    """
+
+    def __init__(self, ttl_seconds: int, maxsize: int = 4096) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl_seconds: Time to live of each entry; 0 disables caching.
+            maxsize: Maximum number of entries, the least recently used are evicted first.
+        """
+        self._ttl = ttl_seconds
+        self._maxsize = maxsize
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any | None:
+        """Get a cached value.
+
+        Args:
+            key: Key of the entry.
+
+        Returns:
+            The cached value, or None if missing or expired.
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value in the cache.
+
+        Args:
+            key: Key of the entry.
+            value: Value to cache.
+        """
+        if self._ttl <= 0:
+            return
+        self._data[key] = (time.monotonic() + self._ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """Remove an entry from the cache.
+
+        Args:
+            key: Key of the entry.
+        """
+        self._data.pop(key, None)
+
+    def delete_if(self, predicate: Callable[[Any], bool]) -> None:
+        """Remove the entries whose value matches a predicate.
+
+        Args:
+            predicate: Function called with each cached value, matching entries are removed.
+        """
+        for key in [key for key, (_, value) in self._data.items() if predicate(value)]:
+            del self._data[key]
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        self._data.clear()
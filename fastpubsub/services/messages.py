@@ -1,19 +1,45 @@
 """Message operations service for publishing, consuming, and managing pub/sub messages."""
 
+import json
 import time
 import uuid
 from typing import Any
 
+import orjson
 from psycopg.types.json import Json
+from pydantic import TypeAdapter
 from sqlalchemy import select, text
 
+from fastpubsub.config import settings
 from fastpubsub.database import SessionLocal
 from fastpubsub.logger import get_logger
 from fastpubsub.models import Message, SubscriptionMetrics
-from fastpubsub.services.helpers import _execute_sql_command
+from fastpubsub.services.helpers import _Coalescer, _execute_sql_command, _raise_not_found_on_no_data
 
 logger = get_logger(__name__)
 
+# Only the columns exposed by the Message model are fetched, and rows are validated in one call
+_MESSAGE_COLUMNS = "id, subscription_id, payload, delivery_attempts, created_at"
+_MESSAGES_ADAPTER = TypeAdapter(list[Message])
+
+
+def _dumps_messages(messages: list[dict[str, Any]]) -> bytes | str:
+    """Encode a batch of messages as JSON.
+
+    Uses orjson and falls back to the standard library for values orjson
+    refuses, such as integers larger than 64 bits.
+
+    Args:
+        messages: List of message dictionaries.
+
+    Returns:
+        The JSON encoded messages.
+    """
+    try:
+        return orjson.dumps(messages)
+    except orjson.JSONEncodeError:
+        return json.dumps(messages)
+
 
 async def publish_messages(topic_id: str, messages: list[dict[str, Any]]) -> int:
     """Publish messages to a topic.
@@ -24,20 +50,26 @@ async def publish_messages(topic_id: str, messages: list[dict[str, Any]]) -> int
 
     Returns:
         Number of messages successfully published.
+
+    Raises:
+        NotFoundError: If the topic doesn't exist.
     """
     start_time = time.perf_counter()
     logger.info("publishing messages", extra={"topic_id": topic_id, "message_count": len(messages)})
 
     try:
-        query = "SELECT publish_messages(:topic_id, CAST(:messages AS jsonb[]))"
-        stmt = text(query).bindparams(topic_id=topic_id, messages=messages)
-        jsonb_array = [Json(m) for m in messages]
+        # The whole batch is sent as a single jsonb document and unnested server side
+        query = (
+            "SELECT publish_messages(:topic_id, ARRAY(SELECT jsonb_array_elements(CAST(:messages AS jsonb))))"
+        )
+        stmt = text(query)
 
         async with SessionLocal() as session:
-            result = await session.execute(
-                stmt,
-                {"topic_id": topic_id, "messages": jsonb_array},
-            )
+            with _raise_not_found_on_no_data("Topic not found"):
+                result = await session.execute(
+                    stmt,
+                    {"topic_id": topic_id, "messages": Json(messages, dumps=_dumps_messages)},
+                )
             count = result.scalar_one()
             await session.commit()
 
@@ -76,6 +108,9 @@ async def consume_messages(subscription_id: str, consumer_id: str, batch_size: i
 
     Returns:
         List of available messages for consumption.
+
+    Raises:
+        NotFoundError: If the subscription doesn't exist.
     """
     start_time = time.perf_counter()
     logger.info(
@@ -84,22 +119,25 @@ async def consume_messages(subscription_id: str, consumer_id: str, batch_size: i
     )
 
     try:
-        query = "SELECT * FROM consume_messages(:subscription_id, :consumer_id, :batch_size)"
+        query = (
+            f"SELECT {_MESSAGE_COLUMNS} FROM consume_messages(:subscription_id, :consumer_id, :batch_size)"
+        )
         stmt = text(query)
 
         async with SessionLocal() as session:
-            result = await session.execute(
-                stmt,
-                {
-                    "subscription_id": subscription_id,
-                    "consumer_id": consumer_id,
-                    "batch_size": batch_size,
-                },
-            )
-            rows = result.mappings().all()
+            with _raise_not_found_on_no_data("Subscription not found"):
+                result = await session.execute(
+                    stmt,
+                    {
+                        "subscription_id": subscription_id,
+                        "consumer_id": consumer_id,
+                        "batch_size": batch_size,
+                    },
+                )
+            rows = result.all()
             await session.commit()
 
-        messages = [Message(**row) for row in rows]
+        messages = _MESSAGES_ADAPTER.validate_python(rows, from_attributes=True)
         duration = time.perf_counter() - start_time
         logger.info(
             "messages consumed",
@@ -127,15 +165,66 @@ async def consume_messages(subscription_id: str, consumer_id: str, batch_size: i
         raise
 
 
-async def ack_messages(subscription_id: str, message_ids: list[uuid.UUID]) -> bool:
+async def _flush_acks(subscription_id: str, message_ids: list[str]) -> bool:
+    """Acknowledge a batch of messages collected by the ack coalescer.
+
+    Args:
+        subscription_id: ID of the subscription.
+        message_ids: List of message ids to acknowledge.
+
+    Returns:
+        True if exactly one row was affected, False otherwise.
+
+    Raises:
+        NotFoundError: If the subscription doesn't exist.
+    """
+    query = "SELECT ack_messages(:subscription_id, CAST(:message_ids AS uuid[]))"
+    with _raise_not_found_on_no_data("Subscription not found"):
+        return await _execute_sql_command(
+            query, {"subscription_id": subscription_id, "message_ids": message_ids}
+        )
+
+
+async def _flush_nacks(subscription_id: str, message_ids: list[str]) -> bool:
+    """Negatively acknowledge a batch of messages collected by the nack coalescer.
+
+    Args:
+        subscription_id: ID of the subscription.
+        message_ids: List of message ids to negatively acknowledge.
+
+    Returns:
+        True if exactly one row was affected, False otherwise.
+
+    Raises:
+        NotFoundError: If the subscription doesn't exist.
+    """
+    query = "SELECT nack_messages(:subscription_id, CAST(:message_ids AS uuid[]))"
+    with _raise_not_found_on_no_data("Subscription not found"):
+        return await _execute_sql_command(
+            query, {"subscription_id": subscription_id, "message_ids": message_ids}
+        )
+
+
+# Concurrent acks/nacks for the same subscription are merged into a single stored procedure call
+_ack_coalescer = _Coalescer(_flush_acks, settings.ack_batch_window_ms, settings.ack_batch_max_size)
+_nack_coalescer = _Coalescer(_flush_nacks, settings.ack_batch_window_ms, settings.ack_batch_max_size)
+
+
+async def ack_messages(subscription_id: str, message_ids: list[str] | list[uuid.UUID]) -> bool:
     """Acknowledge successful processing of messages.
 
+    Concurrent calls for the same subscription are merged into a single
+    database call, see the ack_batch_* settings.
+
     Args:
         subscription_id: ID of the subscription.
-        message_ids: List of message UUIDs to acknowledge.
+        message_ids: List of message ids (strings or UUIDs) to acknowledge.
 
     Returns:
         True if exactly one row was affected, False otherwise.
+
+    Raises:
+        NotFoundError: If the subscription doesn't exist.
     """
     start_time = time.perf_counter()
     logger.info(
@@ -148,10 +237,7 @@ async def ack_messages(subscription_id: str, message_ids: list[uuid.UUID]) -> bo
     )
 
     try:
-        query = "SELECT ack_messages(:subscription_id, :message_ids)"
-        result = await _execute_sql_command(
-            query, {"subscription_id": subscription_id, "message_ids": message_ids}
-        )
+        result = await _ack_coalescer.submit(subscription_id, [str(mid) for mid in message_ids])
 
         duration = time.perf_counter() - start_time
         logger.info(
@@ -179,15 +265,21 @@ async def ack_messages(subscription_id: str, message_ids: list[uuid.UUID]) -> bo
         raise
 
 
-async def nack_messages(subscription_id: str, message_ids: list[uuid.UUID]) -> bool:
+async def nack_messages(subscription_id: str, message_ids: list[str] | list[uuid.UUID]) -> bool:
     """Negative acknowledgment of message processing failure.
 
+    Concurrent calls for the same subscription are merged into a single
+    database call, see the ack_batch_* settings.
+
     Args:
         subscription_id: ID of the subscription.
-        message_ids: List of message UUIDs to negatively acknowledge.
+        message_ids: List of message ids (strings or UUIDs) to negatively acknowledge.
 
     Returns:
         True if exactly one row was affected, False otherwise.
+
+    Raises:
+        NotFoundError: If the subscription doesn't exist.
     """
     start_time = time.perf_counter()
     logger.warning(
@@ -200,10 +292,7 @@ async def nack_messages(subscription_id: str, message_ids: list[uuid.UUID]) -> b
     )
 
     try:
-        query = "SELECT nack_messages(:subscription_id, :message_ids)"
-        result = await _execute_sql_command(
-            query, {"subscription_id": subscription_id, "message_ids": message_ids}
-        )
+        result = await _nack_coalescer.submit(subscription_id, [str(mid) for mid in message_ids])
 
         duration = time.perf_counter() - start_time
         logger.warning(
@@ -241,36 +330,70 @@ async def list_dlq_messages(subscription_id: str, offset: int = 0, limit: int =
 
     Returns:
         List of messages in the DLQ.
+
+    Raises:
+        NotFoundError: If the subscription doesn't exist.
     """
-    query = "SELECT * FROM list_dlq_messages(:subscription_id, :offset, :limit)"
+    query = f"SELECT {_MESSAGE_COLUMNS} FROM list_dlq_messages(:subscription_id, :offset, :limit)"
     stmt = text(query)
 
     async with SessionLocal() as session:
-        result = await session.execute(
-            stmt,
-            {
-                "subscription_id": subscription_id,
-                "offset": offset,
-                "limit": limit,
-            },
-        )
-        rows = result.mappings().all()
+        with _raise_not_found_on_no_data("Subscription not found"):
+            result = await session.execute(
+                stmt,
+                {
+                    "subscription_id": subscription_id,
+                    "offset": offset,
+                    "limit": limit,
+                },
+            )
+        rows = result.all()
 
-    return [Message(**row) for row in rows]
+    return _MESSAGES_ADAPTER.validate_python(rows, from_attributes=True)
 
 
-async def reprocess_dlq_messages(subscription_id: str, message_ids: list[uuid.UUID]) -> bool:
+async def reprocess_dlq_messages(subscription_id: str, message_ids: list[str] | list[uuid.UUID]) -> bool:
     """Move dead letter queue messages back to active processing.
 
     Args:
         subscription_id: ID of the subscription.
-        message_ids: List of message UUIDs to reprocess.
+        message_ids: List of message ids (strings or UUIDs) to reprocess.
 
     Returns:
         True if exactly one row was affected, False otherwise.
+
+    Raises:
+        NotFoundError: If the subscription doesn't exist.
+    """
+    query = "SELECT reprocess_dlq_messages(:subscription_id, CAST(:message_ids AS uuid[]))"
+    with _raise_not_found_on_no_data("Subscription not found"):
+        return await _execute_sql_command(
+            query, {"subscription_id": subscription_id, "message_ids": message_ids}
+        )
+
+
+async def _run_cleanup_batches(query: str, params: dict[str, Any]) -> int:
+    """Run a batched cleanup procedure until it returns a short batch.
+
+    Each batch is committed in its own transaction, so row locks are only
+    held for one batch at a time.
+
+    Args:
+        query: SQL query calling the cleanup procedure, returning the number of rows handled.
+        params: Query parameters, including batch_size.
+
+    Returns:
+        Total number of rows handled.
     """
-    query = "SELECT reprocess_dlq_messages(:subscription_id, :message_ids)"
-    return await _execute_sql_command(query, {"subscription_id": subscription_id, "message_ids": message_ids})
+    stmt = text(query)
+    total = 0
+    while True:
+        async with SessionLocal() as session:
+            count = await session.scalar(stmt, params)
+            await session.commit()
+        total += count
+        if count < params["batch_size"]:
+            return total
 
 
 async def cleanup_stuck_messages(lock_timeout_seconds: int) -> bool:
@@ -286,19 +409,21 @@ async def cleanup_stuck_messages(lock_timeout_seconds: int) -> bool:
     logger.info("cleaning up stuck messages", extra={"lock_timeout_seconds": lock_timeout_seconds})
 
     try:
-        query = "SELECT cleanup_stuck_messages(make_interval(secs => :timeout))"
-        result = await _execute_sql_command(query, {"timeout": lock_timeout_seconds})
+        query = "SELECT cleanup_stuck_messages(make_interval(secs => :timeout), :batch_size)"
+        count = await _run_cleanup_batches(
+            query, {"timeout": lock_timeout_seconds, "batch_size": settings.cleanup_batch_size}
+        )
 
         duration = time.perf_counter() - start_time
         logger.info(
             "stuck messages cleanup completed",
             extra={
                 "lock_timeout_seconds": lock_timeout_seconds,
-                "success": result,
+                "message_count": count,
                 "duration": f"{duration:.4f}s",
             },
         )
-        return result
+        return True
     except Exception as e:
         duration = time.perf_counter() - start_time
         logger.error(
@@ -325,19 +450,21 @@ async def cleanup_acked_messages(older_than_seconds: int) -> bool:
     logger.info("cleaning up acknowledged messages", extra={"older_than_seconds": older_than_seconds})
 
     try:
-        query = "SELECT cleanup_acked_messages(make_interval(secs => :older_than))"
-        result = await _execute_sql_command(query, {"older_than": older_than_seconds})
+        query = "SELECT cleanup_acked_messages(make_interval(secs => :older_than), :batch_size)"
+        count = await _run_cleanup_batches(
+            query, {"older_than": older_than_seconds, "batch_size": settings.cleanup_batch_size}
+        )
 
         duration = time.perf_counter() - start_time
         logger.info(
             "acknowledged messages cleanup completed",
             extra={
                 "older_than_seconds": older_than_seconds,
-                "success": result,
+                "message_count": count,
                 "duration": f"{duration:.4f}s",
             },
         )
-        return result
+        return True
     except Exception as e:
         duration = time.perf_counter() - start_time
         logger.error(
@@ -355,12 +482,16 @@ async def subscription_metrics(subscription_id: str) -> SubscriptionMetrics:
 
     Returns:
         SubscriptionMetrics containing message counts by state.
+
+    Raises:
+        NotFoundError: If the subscription doesn't exist.
     """
     query = "SELECT * FROM subscription_metrics(:subscription_id)"
     stmt = text(query)
 
     async with SessionLocal() as session:
-        result = await session.execute(stmt, {"subscription_id": subscription_id})
+        with _raise_not_found_on_no_data("Subscription not found"):
+            result = await session.execute(stmt, {"subscription_id": subscription_id})
         row = result.mappings().one()
         result_dict = dict(row)
         result_dict["subscription_id"] = subscription_id
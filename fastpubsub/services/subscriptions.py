@@ -5,14 +5,16 @@ import time
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 
+from fastpubsub.config import settings
 from fastpubsub.database import is_foreign_key_violation, is_unique_violation, SessionLocal
 from fastpubsub.database import Subscription as DBSubscription
 from fastpubsub.exceptions import AlreadyExistsError, NotFoundError
 from fastpubsub.logger import get_logger
 from fastpubsub.models import CreateSubscription, Subscription
-from fastpubsub.services.helpers import _delete_entity, _get_entity, utc_now
+from fastpubsub.services.helpers import _delete_entity, _get_entity, _TTLCache, utc_now
 
 logger = get_logger(__name__)
+_subscription_cache = _TTLCache(settings.cache_ttl_seconds)
 
 
 async def create_subscription(data: CreateSubscription) -> Subscription:
@@ -91,6 +93,8 @@ async def create_subscription(data: CreateSubscription) -> Subscription:
 async def get_subscription(subscription_id: str) -> Subscription:
     """Retrieve a subscription by ID.
 
+    Subscriptions are cached in process for cache_ttl_seconds.
+
     Args:
         subscription_id: ID of the subscription to retrieve.
 
@@ -100,6 +104,10 @@ async def get_subscription(subscription_id: str) -> Subscription:
     Raises:
         NotFoundError: If no subscription with the given ID exists.
     """
+    subscription = _subscription_cache.get(subscription_id)
+    if subscription is not None:
+        return subscription
+
     start_time = time.perf_counter()
     logger.debug("getting subscription", extra={"subscription_id": subscription_id})
 
@@ -118,7 +126,9 @@ async def get_subscription(subscription_id: str) -> Subscription:
                 "duration": f"{duration:.4f}s",
             },
         )
-        return Subscription(**db_subscription.to_dict())
+        subscription = Subscription(**db_subscription.to_dict())
+        _subscription_cache.set(subscription_id, subscription)
+        return subscription
     except Exception as e:
         duration = time.perf_counter() - start_time
         logger.warning(
@@ -182,7 +192,10 @@ async def delete_subscription(subscription_id: str) -> None:
 
     try:
         async with SessionLocal() as session:
-            await _delete_entity(session, DBSubscription, subscription_id, "Subscription not found")
+            try:
+                await _delete_entity(session, DBSubscription, subscription_id, "Subscription not found")
+            finally:
+                _subscription_cache.delete(subscription_id)
 
         duration = time.perf_counter() - start_time
         logger.info(
@@ -5,14 +5,17 @@ import time
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 
+from fastpubsub.config import settings
 from fastpubsub.database import is_unique_violation, SessionLocal
 from fastpubsub.database import Topic as DBTopic
 from fastpubsub.exceptions import AlreadyExistsError
 from fastpubsub.logger import get_logger
 from fastpubsub.models import CreateTopic, Topic
-from fastpubsub.services.helpers import _delete_entity, _get_entity, utc_now
+from fastpubsub.services.helpers import _delete_entity, _get_entity, _TTLCache, utc_now
+from fastpubsub.services.subscriptions import _subscription_cache
 
 logger = get_logger(__name__)
+_topic_cache = _TTLCache(settings.cache_ttl_seconds)
 
 
 async def create_topic(data: CreateTopic) -> Topic:
@@ -58,6 +61,8 @@ async def create_topic(data: CreateTopic) -> Topic:
 async def get_topic(topic_id: str) -> Topic:
     """Retrieve a topic by ID.
 
+    Topics are cached in process for cache_ttl_seconds.
+
     Args:
         topic_id: ID of the topic to retrieve.
 
@@ -67,6 +72,10 @@ async def get_topic(topic_id: str) -> Topic:
     Raises:
         NotFoundError: If no topic with the given ID exists.
     """
+    topic = _topic_cache.get(topic_id)
+    if topic is not None:
+        return topic
+
     start_time = time.perf_counter()
     logger.debug("getting topic", extra={"topic_id": topic_id})
 
@@ -74,9 +83,11 @@ async def get_topic(topic_id: str) -> Topic:
         async with SessionLocal() as session:
             db_topic = await _get_entity(session, DBTopic, topic_id, "Topic not found")
 
+        topic = Topic(**db_topic.to_dict())
+        _topic_cache.set(topic_id, topic)
         duration = time.perf_counter() - start_time
         logger.debug("topic retrieved", extra={"topic_id": topic_id, "duration": f"{duration:.4f}s"})
-        return Topic(**db_topic.to_dict())
+        return topic
     except Exception as e:
         duration = time.perf_counter() - start_time
         logger.warning(
@@ -140,7 +151,12 @@ async def delete_topic(topic_id: str) -> None:
 
     try:
         async with SessionLocal() as session:
-            await _delete_entity(session, DBTopic, topic_id, "Topic not found")
+            try:
+                await _delete_entity(session, DBTopic, topic_id, "Topic not found")
+            finally:
+                _topic_cache.delete(topic_id)
+                # subscriptions of the topic are deleted in cascade
+                _subscription_cache.clear()
 
         duration = time.perf_counter() - start_time
         logger.info("topic deleted", extra={"topic_id": topic_id, "duration": f"{duration:.4f}s"})
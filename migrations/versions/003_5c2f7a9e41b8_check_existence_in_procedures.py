@@ -0,0 +1,470 @@
+"""Check subscription and topic existence in stored procedures
+
+Revision ID: 5c2f7a9e41b8
+Revises: 3818df3592a5
+Create Date: 2026-01-05 10:12:41.518233
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5c2f7a9e41b8"
+down_revision: str | Sequence[str] | None = "3818df3592a5"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        ---------- Stored procedures ----------
+        -- The existence of the topic/subscription is only checked when nothing matched,
+        -- so the hot path stays a single statement and callers don't need a prefetch.
+        CREATE OR REPLACE FUNCTION publish_messages(
+            p_topic_id TEXT,
+            p_messages JSONB[]
+        )
+        RETURNS INT
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            inserted_count INT;
+        BEGIN
+            WITH messages AS (
+                SELECT m AS payload
+                FROM unnest(p_messages) AS m
+                WHERE jsonb_typeof(m) = 'object'
+            ),
+            eligible AS (
+                SELECT
+                    s.id AS subscription_id,
+                    m.payload
+                FROM subscriptions s
+                JOIN messages m ON TRUE
+                WHERE s.topic_id = p_topic_id
+                AND (
+                    -- no filter or invalid filter -> accept
+                    s.filter IS NULL
+                    OR jsonb_typeof(s.filter) <> 'object'
+                    OR s.filter = '{}'::jsonb
+                    OR NOT EXISTS (
+                        SELECT 1
+                        FROM jsonb_each(s.filter) f(key, allowed_values)
+                        WHERE
+                            jsonb_typeof(allowed_values) = 'array'
+                            AND NOT (
+                                m.payload ->> f.key = ANY (
+                                    SELECT jsonb_array_elements_text(allowed_values)
+                                )
+                            )
+                        )
+                )
+            )
+            INSERT INTO subscription_messages (
+                subscription_id,
+                payload
+            )
+            SELECT
+                subscription_id,
+                payload
+            FROM eligible;
+
+            GET DIAGNOSTICS inserted_count = ROW_COUNT;
+
+            IF inserted_count = 0 AND NOT EXISTS (SELECT 1 FROM topics WHERE id = p_topic_id) THEN
+                RAISE EXCEPTION 'Topic not found' USING ERRCODE = 'no_data_found';
+            END IF;
+
+            RETURN inserted_count;
+        END;
+        $$;
+
+        CREATE OR REPLACE FUNCTION consume_messages(
+            p_subscription_id TEXT,
+            p_consumer_id TEXT,
+            p_batch_size INT
+        )
+        RETURNS SETOF subscription_messages
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+            RETURN QUERY
+            WITH cte AS (
+                SELECT id
+                FROM subscription_messages
+                WHERE subscription_id = p_subscription_id
+                AND status = 'available'
+                AND available_at <= now()
+                ORDER BY available_at
+                LIMIT p_batch_size
+                FOR UPDATE SKIP LOCKED
+            )
+            UPDATE subscription_messages sm
+            SET status = 'delivered',
+                locked_at = now(),
+                locked_by = p_consumer_id,
+                delivery_attempts = sm.delivery_attempts + 1
+            FROM cte
+            WHERE sm.id = cte.id
+            RETURNING sm.*;
+
+            IF NOT FOUND AND NOT EXISTS (SELECT 1 FROM subscriptions WHERE id = p_subscription_id) THEN
+                RAISE EXCEPTION 'Subscription not found' USING ERRCODE = 'no_data_found';
+            END IF;
+        END;
+        $$;
+
+        CREATE OR REPLACE FUNCTION ack_messages(
+            p_subscription_id TEXT,
+            p_message_ids UUID[]
+        )
+        RETURNS INT
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            updated_count INT;
+        BEGIN
+            UPDATE subscription_messages
+            SET status = 'acked',
+                acked_at = now(),
+                locked_at = NULL,
+                locked_by = NULL
+            WHERE subscription_id = p_subscription_id
+            AND id = ANY (p_message_ids)
+            AND status = 'delivered';
+
+            GET DIAGNOSTICS updated_count = ROW_COUNT;
+
+            IF updated_count = 0 AND NOT EXISTS (SELECT 1 FROM subscriptions WHERE id = p_subscription_id) THEN
+                RAISE EXCEPTION 'Subscription not found' USING ERRCODE = 'no_data_found';
+            END IF;
+
+            RETURN updated_count;
+        END;
+        $$;
+
+        CREATE OR REPLACE FUNCTION nack_messages(
+            p_subscription_id TEXT,
+            p_message_ids UUID[]
+        )
+        RETURNS INT
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            sub subscriptions;
+        BEGIN
+            SELECT * INTO sub
+            FROM subscriptions
+            WHERE id = p_subscription_id;
+
+            IF NOT FOUND THEN
+                RAISE EXCEPTION 'Subscription not found' USING ERRCODE = 'no_data_found';
+            END IF;
+
+            UPDATE subscription_messages
+            SET status = CASE
+                WHEN delivery_attempts >= sub.max_delivery_attempts THEN 'dlq'
+                ELSE 'available'
+            END,
+            available_at = CASE
+                WHEN delivery_attempts >= sub.max_delivery_attempts THEN available_at
+                ELSE now() + make_interval(
+                    secs => LEAST(
+                        sub.backoff_max_seconds,
+                        sub.backoff_min_seconds * (2 ^ delivery_attempts)
+                    )
+                )
+            END,
+            locked_at = NULL,
+            locked_by = NULL
+            WHERE id = ANY (p_message_ids)
+            AND subscription_id = p_subscription_id
+            AND status = 'delivered';
+
+            RETURN 1;
+        END;
+        $$;
+
+        CREATE OR REPLACE FUNCTION list_dlq_messages(
+            p_subscription_id TEXT,
+            p_offset INT,
+            p_limit INT
+        )
+        RETURNS SETOF subscription_messages
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+            RETURN QUERY
+            SELECT *
+            FROM subscription_messages
+            WHERE subscription_id = p_subscription_id
+            AND status = 'dlq'
+            ORDER BY created_at
+            OFFSET p_offset
+            LIMIT p_limit;
+
+            IF NOT FOUND AND NOT EXISTS (SELECT 1 FROM subscriptions WHERE id = p_subscription_id) THEN
+                RAISE EXCEPTION 'Subscription not found' USING ERRCODE = 'no_data_found';
+            END IF;
+        END;
+        $$;
+
+        CREATE OR REPLACE FUNCTION reprocess_dlq_messages(
+            p_subscription_id TEXT,
+            p_message_ids UUID[]
+        )
+        RETURNS INT
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            updated_count INT;
+        BEGIN
+            UPDATE subscription_messages
+            SET status = 'available',
+                delivery_attempts = 0,
+                available_at = now()
+            WHERE subscription_id = p_subscription_id
+            AND id = ANY (p_message_ids)
+            AND status = 'dlq';
+
+            GET DIAGNOSTICS updated_count = ROW_COUNT;
+
+            IF updated_count = 0 AND NOT EXISTS (SELECT 1 FROM subscriptions WHERE id = p_subscription_id) THEN
+                RAISE EXCEPTION 'Subscription not found' USING ERRCODE = 'no_data_found';
+            END IF;
+
+            RETURN updated_count;
+        END;
+        $$;
+
+        CREATE OR REPLACE FUNCTION subscription_metrics(
+            p_subscription_id TEXT
+        )
+        RETURNS TABLE (
+            available BIGINT,
+            delivered BIGINT,
+            acked BIGINT,
+            dlq BIGINT
+        )
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+            IF NOT EXISTS (SELECT 1 FROM subscriptions WHERE id = p_subscription_id) THEN
+                RAISE EXCEPTION 'Subscription not found' USING ERRCODE = 'no_data_found';
+            END IF;
+
+            RETURN QUERY
+            SELECT
+                count(*) FILTER (WHERE sm.status = 'available'),
+                count(*) FILTER (WHERE sm.status = 'delivered'),
+                count(*) FILTER (WHERE sm.status = 'acked'),
+                count(*) FILTER (WHERE sm.status = 'dlq')
+            FROM subscription_messages sm
+            WHERE sm.subscription_id = p_subscription_id;
+        END;
+        $$;
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        ---------- Stored procedures ----------
+        CREATE OR REPLACE FUNCTION publish_messages(
+            p_topic_id TEXT,
+            p_messages JSONB[]
+        )
+        RETURNS INT
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            inserted_count INT;
+        BEGIN
+            WITH messages AS (
+                SELECT m AS payload
+                FROM unnest(p_messages) AS m
+                WHERE jsonb_typeof(m) = 'object'
+            ),
+            eligible AS (
+                SELECT
+                    s.id AS subscription_id,
+                    m.payload
+                FROM subscriptions s
+                JOIN messages m ON TRUE
+                WHERE s.topic_id = p_topic_id
+                AND (
+                    -- no filter or invalid filter -> accept
+                    s.filter IS NULL
+                    OR jsonb_typeof(s.filter) <> 'object'
+                    OR s.filter = '{}'::jsonb
+                    OR NOT EXISTS (
+                        SELECT 1
+                        FROM jsonb_each(s.filter) f(key, allowed_values)
+                        WHERE
+                            jsonb_typeof(allowed_values) = 'array'
+                            AND NOT (
+                                m.payload ->> f.key = ANY (
+                                    SELECT jsonb_array_elements_text(allowed_values)
+                                )
+                            )
+                        )
+                )
+            )
+            INSERT INTO subscription_messages (
+                subscription_id,
+                payload
+            )
+            SELECT
+                subscription_id,
+                payload
+            FROM eligible;
+
+            GET DIAGNOSTICS inserted_count = ROW_COUNT;
+
+            RETURN inserted_count;
+        END;
+        $$;
+
+        CREATE OR REPLACE FUNCTION consume_messages(
+            p_subscription_id TEXT,
+            p_consumer_id TEXT,
+            p_batch_size INT
+        )
+        RETURNS SETOF subscription_messages
+        LANGUAGE sql
+        AS $$
+        WITH cte AS (
+            SELECT id
+            FROM subscription_messages
+            WHERE subscription_id = p_subscription_id
+            AND status = 'available'
+            AND available_at <= now()
+            ORDER BY available_at
+            LIMIT p_batch_size
+            FOR UPDATE SKIP LOCKED
+        )
+        UPDATE subscription_messages sm
+        SET status = 'delivered',
+            locked_at = now(),
+            locked_by = p_consumer_id,
+            delivery_attempts = delivery_attempts + 1
+        FROM cte
+        WHERE sm.id = cte.id
+        RETURNING sm.*;
+        $$;
+
+        CREATE OR REPLACE FUNCTION ack_messages(
+            p_subscription_id TEXT,
+            p_message_ids UUID[]
+        )
+        RETURNS INT
+        LANGUAGE sql
+        AS $$
+        UPDATE subscription_messages
+        SET status = 'acked',
+            acked_at = now(),
+            locked_at = NULL,
+            locked_by = NULL
+        WHERE subscription_id = p_subscription_id
+        AND id = ANY (p_message_ids)
+        AND status = 'delivered'
+        RETURNING 1;
+        $$;
+
+        CREATE OR REPLACE FUNCTION nack_messages(
+            p_subscription_id TEXT,
+            p_message_ids UUID[]
+        )
+        RETURNS INT
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            sub subscriptions;
+        BEGIN
+            SELECT * INTO sub
+            FROM subscriptions
+            WHERE id = p_subscription_id;
+
+            UPDATE subscription_messages
+            SET status = CASE
+                WHEN delivery_attempts >= sub.max_delivery_attempts THEN 'dlq'
+                ELSE 'available'
+            END,
+            available_at = CASE
+                WHEN delivery_attempts >= sub.max_delivery_attempts THEN available_at
+                ELSE now() + make_interval(
+                    secs => LEAST(
+                        sub.backoff_max_seconds,
+                        sub.backoff_min_seconds * (2 ^ delivery_attempts)
+                    )
+                )
+            END,
+            locked_at = NULL,
+            locked_by = NULL
+            WHERE id = ANY (p_message_ids)
+            AND subscription_id = p_subscription_id
+            AND status = 'delivered';
+
+            RETURN 1;
+        END;
+        $$;
+
+        CREATE OR REPLACE FUNCTION list_dlq_messages(
+            p_subscription_id TEXT,
+            p_offset INT,
+            p_limit INT
+        )
+        RETURNS SETOF subscription_messages
+        LANGUAGE sql
+        AS $$
+        SELECT *
+        FROM subscription_messages
+        WHERE subscription_id = p_subscription_id
+        AND status = 'dlq'
+        ORDER BY created_at
+        OFFSET p_offset
+        LIMIT p_limit;
+        $$;
+
+        CREATE OR REPLACE FUNCTION reprocess_dlq_messages(
+            p_subscription_id TEXT,
+            p_message_ids UUID[]
+        )
+        RETURNS INT
+        LANGUAGE sql
+        AS $$
+        UPDATE subscription_messages
+        SET status = 'available',
+            delivery_attempts = 0,
+            available_at = now()
+        WHERE subscription_id = p_subscription_id
+        AND id = ANY (p_message_ids)
+        AND status = 'dlq'
+        RETURNING 1;
+        $$;
+
+        CREATE OR REPLACE FUNCTION subscription_metrics(
+            p_subscription_id TEXT
+        )
+        RETURNS TABLE (
+            available BIGINT,
+            delivered BIGINT,
+            acked BIGINT,
+            dlq BIGINT
+        )
+        LANGUAGE sql
+        AS $$
+        SELECT
+            count(*) FILTER (WHERE status = 'available'),
+            count(*) FILTER (WHERE status = 'delivered'),
+            count(*) FILTER (WHERE status = 'acked'),
+            count(*) FILTER (WHERE status = 'dlq')
+        FROM subscription_messages
+        WHERE subscription_id = p_subscription_id;
+        $$;
+        """
+    )
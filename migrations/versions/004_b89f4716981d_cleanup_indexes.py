@@ -0,0 +1,43 @@
+"""Add partial indexes for the cleanup procedures
+
+Revision ID: b89f4716981d
+Revises: 5c2f7a9e41b8
+Create Date: 2026-10-15 09:41:07.204518
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b89f4716981d"
+down_revision: str | Sequence[str] | None = "5c2f7a9e41b8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        ---------- Indexes ----------
+        -- Cleanup of acked messages
+        CREATE INDEX IF NOT EXISTS idx_sub_msgs_acked_at
+        ON subscription_messages (acked_at)
+        WHERE status = 'acked';
+
+        -- Cleanup of stuck messages
+        CREATE INDEX IF NOT EXISTS idx_sub_msgs_delivered_locked_at
+        ON subscription_messages (locked_at)
+        WHERE status = 'delivered';
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        DROP INDEX IF EXISTS idx_sub_msgs_delivered_locked_at;
+        DROP INDEX IF EXISTS idx_sub_msgs_acked_at;
+        """
+    )
@@ -0,0 +1,38 @@
+"""Drop the unused GIN index on message payloads
+
+Revision ID: 25dff2fd0a9f
+Revises: b89f4716981d
+Create Date: 2026-10-15 10:26:53.870112
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "25dff2fd0a9f"
+down_revision: str | Sequence[str] | None = "b89f4716981d"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        ---------- Indexes ----------
+        -- Subscription filters are matched against the published messages before they are
+        -- inserted, stored payloads are never searched, so the index only cost writes and space.
+        DROP INDEX IF EXISTS idx_sub_msgs_payload_gin;
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_sub_msgs_payload_gin
+        ON subscription_messages
+        USING GIN (payload jsonb_path_ops);
+        """
+    )
@@ -0,0 +1,119 @@
+"""Process cleanup procedures in bounded batches
+
+Revision ID: 8de44569bed0
+Revises: 25dff2fd0a9f
+Create Date: 2026-10-15 11:58:32.640271
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8de44569bed0"
+down_revision: str | Sequence[str] | None = "25dff2fd0a9f"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        ---------- Stored procedures ----------
+        -- Each call handles at most p_batch_size rows and returns how many were handled,
+        -- callers repeat it until a short batch. Rows locked by consumers are skipped.
+        DROP FUNCTION IF EXISTS cleanup_stuck_messages(INTERVAL);
+        DROP FUNCTION IF EXISTS cleanup_acked_messages(INTERVAL);
+
+        CREATE OR REPLACE FUNCTION cleanup_stuck_messages(
+            p_lock_timeout INTERVAL,
+            p_batch_size INT
+        )
+        RETURNS INT
+        LANGUAGE sql
+        AS $$
+        WITH batch AS (
+            SELECT id
+            FROM subscription_messages
+            WHERE status = 'delivered'
+            AND locked_at < now() - p_lock_timeout
+            ORDER BY locked_at
+            LIMIT p_batch_size
+            FOR UPDATE SKIP LOCKED
+        ),
+        updated AS (
+            UPDATE subscription_messages sm
+            SET status = 'available',
+                locked_at = NULL,
+                locked_by = NULL
+            FROM batch
+            WHERE sm.id = batch.id
+            RETURNING 1
+        )
+        SELECT count(*)::INT FROM updated;
+        $$;
+
+        CREATE OR REPLACE FUNCTION cleanup_acked_messages(
+            p_older_than INTERVAL,
+            p_batch_size INT
+        )
+        RETURNS INT
+        LANGUAGE sql
+        AS $$
+        WITH batch AS (
+            SELECT id
+            FROM subscription_messages
+            WHERE status = 'acked'
+            AND acked_at < now() - p_older_than
+            ORDER BY acked_at
+            LIMIT p_batch_size
+            FOR UPDATE SKIP LOCKED
+        ),
+        deleted AS (
+            DELETE FROM subscription_messages sm
+            USING batch
+            WHERE sm.id = batch.id
+            RETURNING 1
+        )
+        SELECT count(*)::INT FROM deleted;
+        $$;
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        ---------- Stored procedures ----------
+        DROP FUNCTION IF EXISTS cleanup_stuck_messages(INTERVAL, INT);
+        DROP FUNCTION IF EXISTS cleanup_acked_messages(INTERVAL, INT);
+
+        CREATE OR REPLACE FUNCTION cleanup_stuck_messages(
+            p_lock_timeout INTERVAL
+        )
+        RETURNS INT
+        LANGUAGE sql
+        AS $$
+        UPDATE subscription_messages
+        SET status = 'available',
+            locked_at = NULL,
+            locked_by = NULL
+        WHERE status = 'delivered'
+        AND locked_at < now() - p_lock_timeout
+        RETURNING 1;
+        $$;
+
+        CREATE OR REPLACE FUNCTION cleanup_acked_messages(
+            p_older_than INTERVAL
+        )
+        RETURNS INT
+        LANGUAGE sql
+        AS $$
+        DELETE FROM subscription_messages
+        WHERE status = 'acked'
+        AND acked_at < now() - p_older_than
+        RETURNING 1;
+        $$;
+        """
+    )
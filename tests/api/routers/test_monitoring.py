@@ -2,6 +2,7 @@ from unittest import mock
 
 from fastapi import status
 
+from fastpubsub.api.routers import monitoring
 from fastpubsub.exceptions import ServiceUnavailable
 
 
@@ -11,6 +12,12 @@ def test_liveness_probe(client):
 
     assert response.status_code == status.HTTP_200_OK
     assert response_data == {"status": "alive"}
+    assert response.headers["cache-control"] == "max-age=1"
+
+    response = client.get("/liveness", headers={"If-None-Match": response.headers["etag"]})
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
 
 
 def test_readiness_probe(session, client):
@@ -22,6 +29,7 @@ def test_readiness_probe(session, client):
 
 
 def test_readiness_probe_with_exception(session, client):
+    monitoring._readiness_cache = None
     with mock.patch("fastpubsub.api.routers.monitoring.services.database_ping") as mock_database_ping:
         mock_database_ping.side_effect = [ServiceUnavailable("database is down")]
         response = client.get("/readiness")
@@ -29,6 +37,36 @@ def test_readiness_probe_with_exception(session, client):
 
     assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
     assert response_data == {"detail": "database is down"}
+    monitoring._readiness_cache = None
+
+
+def test_readiness_probe_with_connection_error(session, client):
+    monitoring._readiness_cache = None
+    with mock.patch("fastpubsub.api.routers.monitoring.services.database_ping") as mock_database_ping:
+        mock_database_ping.side_effect = [ConnectionRefusedError("connection refused")]
+        response = client.get("/readiness")
+        response_data = response.json()
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response_data == {"detail": "database is down"}
+    monitoring._readiness_cache = None
+
+
+def test_readiness_probe_with_cache(session, client):
+    monitoring._readiness_cache = None
+    with mock.patch("fastpubsub.api.routers.monitoring.services.database_ping") as mock_database_ping:
+        mock_database_ping.return_value = True
+        for _ in range(3):
+            response = client.get("/readiness")
+            assert response.status_code == status.HTTP_200_OK
+
+        monitoring._readiness_cache = (monitoring._readiness_cache[0] - 2, True)
+        mock_database_ping.return_value = False
+        response = client.get("/readiness")
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert mock_database_ping.call_count == 2
+    monitoring._readiness_cache = None
 
 
 def test_prometheus_metrics(client):
@@ -1,3 +1,4 @@
+import pytest
 from fastapi import status
 
 from fastpubsub.models import CreateSubscription, CreateTopic
@@ -244,6 +245,13 @@ def test_subscription_metrics(session, client):
         "dlq": 0,
         "subscription_id": "my-subscription",
     }
+    assert response.headers["cache-control"] == "private, no-cache"
+
+    response = client.get(
+        "/subscriptions/my-subscription/metrics", headers={"If-None-Match": response.headers["etag"]}
+    )
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
 
     response = client.get("/subscriptions/not-found-subscription/metrics")
     response_data = response.json()
@@ -352,3 +360,28 @@ def test_subscription_filter_with_special_characters(session, client):
     assert any("&gt;" in val for val in response_data["filter"]["field1"])
     assert any("&quot;" in val for val in response_data["filter"]["field2"])
     assert any("&#x27;" in val for val in response_data["filter"]["field2"])
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/subscriptions/my-subscription/acks",
+        "/subscriptions/my-subscription/nacks",
+        "/subscriptions/my-subscription/dlq/reprocess",
+    ],
+)
+@pytest.mark.parametrize(
+    "content,error_type",
+    [
+        (b'["not-a-uuid"]', "uuid_parsing"),
+        (b"[1]", "uuid_parsing"),
+        (b'{"id": "0195a6b2-2b7c-7b1e-8f3a-2c4d5e6f7a8b"}', "list_type"),
+        (b"[", "json_invalid"),
+    ],
+)
+def test_message_ids_validation(session, client, path, content, error_type):
+    response = client.post(path, content=content, headers={"Content-Type": "application/json"})
+    response_data = response.json()
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+    assert response_data["detail"][0]["type"] == error_type
@@ -94,3 +94,48 @@ def test_publish_messages(session, client):
 
     assert response.status_code == status.HTTP_404_NOT_FOUND
     assert response_data == {"detail": "Topic not found"}
+
+
+def test_get_topic_with_etag(session, client):
+    sync_call_function(create_topic, data=CreateTopic(id="my-topic"))
+
+    response = client.get("/topics/my-topic")
+    etag = response.headers["etag"]
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["cache-control"] == "private, max-age=5"
+
+    response = client.get("/topics/my-topic", headers={"If-None-Match": etag})
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+
+    sync_call_function(create_topic, data=CreateTopic(id="my-topic-2"))
+    response = client.get("/topics", headers={"If-None-Match": etag})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["etag"] != etag
+
+
+def test_list_topic_with_gzip(session, client):
+    for i in range(50):
+        sync_call_function(create_topic, data=CreateTopic(id=f"my-topic-{i}"))
+
+    response = client.get("/topics", params={"limit": 50}, headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(response.json()["data"]) == 50
+
+    response = client.get("/topics", params={"limit": 1}, headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert "content-encoding" not in response.headers
+
+
+def test_create_topic_with_invalid_json(session, client):
+    response = client.post("/topics", content=b'{"id": ', headers={"Content-Type": "application/json"})
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+    assert response.json()["detail"][0]["type"] == "json_invalid"
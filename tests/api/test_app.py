@@ -0,0 +1,103 @@
+from unittest import mock
+
+import orjson
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from fastpubsub.api import app
+from fastpubsub.api.app import create_app, domain_exception_handler
+from fastpubsub.config import settings
+from fastpubsub.database import engine
+from fastpubsub.exceptions import (
+    AlreadyExistsError,
+    InvalidClient,
+    InvalidClientToken,
+    NotFoundError,
+    ServiceUnavailable,
+)
+
+
+def test_lifespan_warms_up_pool(session):
+    with TestClient(app) as client:
+        assert engine.pool.checkedin() >= settings.database_pool_size
+
+        response = client.get("/liveness")
+        assert response.status_code == status.HTTP_200_OK
+
+    assert engine.pool.checkedin() == 0
+
+
+def test_create_app_reuses_instrumentator():
+    other_app = create_app()
+
+    with TestClient(other_app) as client:
+        response = client.get("/metrics")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert "/metrics" not in other_app.openapi()["paths"]
+
+
+class _SubscriptionNotFoundError(NotFoundError):
+    pass
+
+
+@pytest.mark.parametrize(
+    "exc,status_code",
+    [
+        (AlreadyExistsError("Topic already exists"), status.HTTP_409_CONFLICT),
+        (NotFoundError("Topic not found"), status.HTTP_404_NOT_FOUND),
+        (ServiceUnavailable("database is down"), status.HTTP_503_SERVICE_UNAVAILABLE),
+        (InvalidClient("Client not found"), status.HTTP_401_UNAUTHORIZED),
+        (InvalidClientToken("Invalid token"), status.HTTP_403_FORBIDDEN),
+        (_SubscriptionNotFoundError("Subscription not found"), status.HTTP_404_NOT_FOUND),
+    ],
+)
+@pytest.mark.asyncio
+async def test_domain_exception_handler(exc, status_code):
+    response = await domain_exception_handler(None, exc)
+
+    assert response.status_code == status_code
+    assert orjson.loads(response.body) == {"detail": exc.args[0]}
+
+
+def test_create_app_without_metrics(monkeypatch):
+    monkeypatch.setattr(settings, "api_metrics_enabled", False)
+    other_app = create_app()
+
+    with TestClient(other_app) as client:
+        response = client.get("/metrics")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_generic_exception_handler_logs_error():
+    with (
+        mock.patch("fastpubsub.api.routers.topics.services.list_topic", side_effect=RuntimeError("boom")),
+        mock.patch("fastpubsub.api.app.logger") as mock_logger,
+    ):
+        client = TestClient(app, raise_server_exceptions=False)
+        response = client.get("/topics")
+
+    assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+    assert response.json() == {"detail": "internal server error"}
+    mock_logger.error.assert_called_once()
+    assert mock_logger.error.call_args.kwargs["extra"]["error"] == "boom"
+    assert isinstance(mock_logger.error.call_args.kwargs["extra"]["time_us"], int)
+
+
+def test_openapi_is_served_precomputed():
+    other_app = create_app()
+
+    with (
+        mock.patch.object(other_app, "openapi", side_effect=AssertionError("schema rebuilt")),
+        TestClient(other_app) as client,
+    ):
+        response = client.get("/openapi.json")
+        docs_response = client.get("/docs")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == other_app.openapi_schema
+    assert "/topics" in response.json()["paths"]
+    assert docs_response.status_code == status.HTTP_200_OK
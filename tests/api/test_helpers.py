@@ -0,0 +1,103 @@
+import datetime
+import uuid
+
+import orjson
+import pytest
+from fastapi import status
+
+from fastpubsub import models
+from fastpubsub.api.helpers import (
+    _create_error_response,
+    _create_validation_error_response,
+    _list_response,
+    _MESSAGE_IDS_OPENAPI,
+    _MESSAGE_LIST_ADAPTER,
+    FastORJSONResponse,
+)
+
+
+def test_fast_orjson_response_with_models():
+    message_id = uuid.uuid7()
+    created_at = datetime.datetime(2025, 1, 1, 12, 30, tzinfo=datetime.UTC)
+    message = models.Message(
+        id=message_id, subscription_id="my-sub", payload={"a": 1}, delivery_attempts=1, created_at=created_at
+    )
+
+    response = FastORJSONResponse({"data": [message]})
+
+    assert response.media_type == "application/json"
+    assert orjson.loads(response.body) == {
+        "data": [
+            {
+                "id": str(message_id),
+                "subscription_id": "my-sub",
+                "payload": {"a": 1},
+                "delivery_attempts": 1,
+                "created_at": "2025-01-01T12:30:00Z",
+            }
+        ]
+    }
+
+
+def test_fast_orjson_response_with_unsupported_type():
+    with pytest.raises(TypeError):
+        FastORJSONResponse({"data": object()})
+
+
+def test_list_response_matches_fast_orjson_response():
+    message = models.Message(
+        id=uuid.uuid7(),
+        subscription_id="my-sub",
+        payload={"a": 1},
+        delivery_attempts=1,
+        created_at=datetime.datetime(2025, 1, 1, 12, 30, tzinfo=datetime.UTC),
+    )
+
+    response = _list_response(_MESSAGE_LIST_ADAPTER, [message])
+
+    assert response.media_type == "application/json"
+    assert response.body == FastORJSONResponse({"data": [message]}).body
+    assert _list_response(_MESSAGE_LIST_ADAPTER, []).body == b'{"data":[]}'
+
+
+def test_create_error_response():
+    response = _create_error_response(status.HTTP_404_NOT_FOUND, "Topic not found")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.media_type == "application/json"
+    assert response.body == b'{"detail":"Topic not found"}'
+
+
+def test_create_validation_error_response():
+    errors = [
+        {
+            "type": "value_error",
+            "loc": ("body", "id"),
+            "msg": "bad",
+            "input": b"raw",
+            "ctx": {"error": ValueError("bad")},
+        }
+    ]
+
+    response = _create_validation_error_response(errors)
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+    assert orjson.loads(response.body) == {
+        "detail": [
+            {
+                "type": "value_error",
+                "loc": ["body", "id"],
+                "msg": "bad",
+                "input": "raw",
+                "ctx": {"error": "bad"},
+            }
+        ]
+    }
+
+
+def test_message_ids_openapi_schema():
+    assert _MESSAGE_IDS_OPENAPI["requestBody"]["content"]["application/json"]["schema"] == {
+        "items": {"format": "uuid", "type": "string"},
+        "title": "Data",
+        "type": "array",
+    }
@@ -0,0 +1,33 @@
+import logging
+
+from fastapi import status
+
+from fastpubsub.logger import request_context, RequestContextFilter
+
+
+def test_log_requests_adds_request_id(session, client):
+    response = client.get("/topics")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.headers["x-request-id"]) == 32
+    assert request_context.get() is None
+
+
+def test_log_requests_skips_probes(client):
+    response = client.get("/liveness")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert "x-request-id" not in response.headers
+
+
+def test_request_context_filter():
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, "response", None, None)
+    record.__dict__["request.method"] = "POST"
+    token = request_context.set({"request.method": "GET", "request.url.path": "/topics"})
+    try:
+        assert RequestContextFilter().filter(record) is True
+    finally:
+        request_context.reset(token)
+
+    assert record.__dict__["request.method"] == "POST"
+    assert record.__dict__["request.url.path"] == "/topics"
@@ -15,6 +15,9 @@ from fastpubsub.database import (
     SubscriptionMessage,
     Topic,
 )
+from fastpubsub.services.clients import _token_cache
+from fastpubsub.services.subscriptions import _subscription_cache
+from fastpubsub.services.topics import _topic_cache
 
 
 @pytest_asyncio.fixture(scope="session")
@@ -54,6 +57,9 @@ async def session(async_engine):
         await sess.execute(delete(Topic))
         await sess.execute(delete(Client))
         await sess.commit()
+        _topic_cache.clear()
+        _subscription_cache.clear()
+        _token_cache.clear()
 
 
 @pytest.fixture
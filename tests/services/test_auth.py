@@ -37,11 +37,11 @@ def app():
 
     @app.exception_handler(InvalidClient)
     def invalid_client_exception_handler(request: Request, exc: InvalidClient):
-        return _create_error_response(models.GenericError, status.HTTP_401_UNAUTHORIZED, exc)
+        return _create_error_response(status.HTTP_401_UNAUTHORIZED, exc.args[0])
 
     @app.exception_handler(InvalidClientToken)
     def invalid_client_token_exception_handler(request: Request, exc: InvalidClientToken):
-        return _create_error_response(models.GenericError, status.HTTP_403_FORBIDDEN, exc)
+        return _create_error_response(status.HTTP_403_FORBIDDEN, exc.args[0])
 
     return app
 
@@ -93,3 +93,8 @@ def test_require_scope(app, make_client_token, monkeypatch):
 
     assert response.status_code == status.HTTP_403_FORBIDDEN
     assert response_data == {"detail": "Insufficient scope"}
+
+
+def test_require_scope_is_memoized():
+    assert services.require_scope("topics", "read") is services.require_scope("topics", "read")
+    assert services.require_scope("topics", "read") is not services.require_scope("topics", "create")
@@ -1,4 +1,5 @@
 import uuid
+from unittest import mock
 
 import pytest
 
@@ -218,6 +219,42 @@ async def test_decode_jwt_client_token(session):
     assert decoded_client.scopes == set(["topics:create", "subscriptions:create"])
 
 
+@pytest.mark.asyncio
+async def test_decode_jwt_client_token_with_cache(session):
+    client_result = await services.create_client(
+        data=CreateClient(name="my client", scopes="*", is_active=True)
+    )
+    client_token = await services.issue_jwt_client_token(
+        client_id=client_result.id, client_secret=client_result.secret
+    )
+    decoded_client = await services.decode_jwt_client_token(client_token.access_token)
+
+    with mock.patch("fastpubsub.services.clients.SessionLocal") as mock_session_local:
+        assert await services.decode_jwt_client_token(client_token.access_token) == decoded_client
+    mock_session_local.assert_not_called()
+
+    other_result = await services.create_client(
+        data=CreateClient(name="other client", scopes="*", is_active=True)
+    )
+    other_token = await services.issue_jwt_client_token(
+        client_id=other_result.id, client_secret=other_result.secret
+    )
+    other_decoded = await services.decode_jwt_client_token(other_token.access_token)
+
+    await services.update_client(
+        client_result.id, data=UpdateClient(name="my client", scopes="*", is_active=True)
+    )
+
+    # only the updated client's tokens are dropped from the cache
+    with mock.patch("fastpubsub.services.clients.SessionLocal") as mock_session_local:
+        assert await services.decode_jwt_client_token(other_token.access_token) == other_decoded
+    mock_session_local.assert_not_called()
+
+    with pytest.raises(InvalidClient) as excinfo:
+        await services.decode_jwt_client_token(client_token.access_token)
+    assert "Token revoked" in str(excinfo.value)
+
+
 @pytest.mark.asyncio
 async def test_decode_jwt_client_token_with_auth_disabled():
     decoded_client = await services.decode_jwt_client_token("", auth_enabled=False)
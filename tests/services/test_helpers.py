@@ -0,0 +1,133 @@
+import asyncio
+import time
+
+import pytest
+
+from fastpubsub.exceptions import NotFoundError
+from fastpubsub.services.helpers import _Coalescer, _TTLCache
+
+
+def make_flush(calls, exc=None):
+    async def flush(key, items):
+        calls.append((key, list(items)))
+        if exc is not None:
+            raise exc
+        return True
+
+    return flush
+
+
+@pytest.mark.asyncio
+async def test_coalescer_merges_concurrent_calls():
+    calls = []
+    coalescer = _Coalescer(make_flush(calls), window_ms=5, max_size=100)
+
+    results = await asyncio.gather(
+        coalescer.submit("sub-1", ["a"]),
+        coalescer.submit("sub-1", ["b", "c"]),
+        coalescer.submit("sub-2", ["d"]),
+    )
+
+    assert results == [True, True, True]
+    assert sorted(calls) == [("sub-1", ["a", "b", "c"]), ("sub-2", ["d"])]
+
+
+@pytest.mark.asyncio
+async def test_coalescer_flushes_when_max_size_is_reached():
+    calls = []
+    coalescer = _Coalescer(make_flush(calls), window_ms=60_000, max_size=2)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(coalescer.submit("sub", ["a"]), coalescer.submit("sub", ["b"])), timeout=1
+    )
+
+    assert results == [True, True]
+    assert calls == [("sub", ["a", "b"])]
+
+
+@pytest.mark.asyncio
+async def test_coalescer_propagates_exceptions():
+    calls = []
+    coalescer = _Coalescer(
+        make_flush(calls, NotFoundError("Subscription not found")), window_ms=5, max_size=100
+    )
+
+    results = await asyncio.gather(
+        coalescer.submit("sub", ["a"]), coalescer.submit("sub", ["b"]), return_exceptions=True
+    )
+
+    assert len(calls) == 1
+    assert all(isinstance(result, NotFoundError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_coalescer_cancelled_flush_releases_callers():
+    started = asyncio.Event()
+
+    async def flush(key, items):
+        started.set()
+        await asyncio.Event().wait()
+
+    coalescer = _Coalescer(flush, window_ms=60_000, max_size=2)
+    submitters = asyncio.gather(
+        coalescer.submit("sub", ["a"]), coalescer.submit("sub", ["b"]), return_exceptions=True
+    )
+    await started.wait()
+    for task in coalescer._tasks:
+        task.cancel()
+
+    results = await asyncio.wait_for(submitters, timeout=1)
+
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_coalescer_without_window():
+    calls = []
+    coalescer = _Coalescer(make_flush(calls), window_ms=0, max_size=100)
+
+    await asyncio.gather(coalescer.submit("sub", ["a"]), coalescer.submit("sub", ["b"]))
+
+    assert calls == [("sub", ["a"]), ("sub", ["b"])]
+
+
+def test_ttl_cache():
+    cache = _TTLCache(ttl_seconds=30, maxsize=2)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    # "b" is the least recently used entry
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+    cache.delete("a")
+    assert cache.get("a") is None
+
+    cache.set("a", 1)
+    cache.delete_if(lambda value: value == 1)
+    assert cache.get("a") is None
+    assert cache.get("c") == 3
+
+    cache.clear()
+    assert cache.get("c") is None
+
+
+def test_ttl_cache_expiration(monkeypatch):
+    cache = _TTLCache(ttl_seconds=30)
+    cache.set("a", 1)
+
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 31)
+
+    assert cache.get("a") is None
+
+
+def test_ttl_cache_disabled():
+    cache = _TTLCache(ttl_seconds=0)
+    cache.set("a", 1)
+
+    assert cache.get("a") is None
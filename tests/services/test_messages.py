@@ -1,10 +1,14 @@
+import asyncio
 import time
+import uuid
 
 import pytest
 from sqlalchemy import select
 
 from fastpubsub import services
+from fastpubsub.config import settings
 from fastpubsub.database import SubscriptionMessage as DBSubscriptionMessage
+from fastpubsub.exceptions import NotFoundError
 from fastpubsub.models import CreateSubscription, CreateTopic, SubscriptionMetrics
 
 
@@ -283,6 +287,28 @@ async def test_cleanup_acked_messages(session, messages):
     assert len(db_messages) == 0
 
 
+@pytest.mark.asyncio
+async def test_cleanup_acked_messages_in_batches(session, messages, monkeypatch):
+    topic_id = "my_topic"
+    subscription_id = "my_sub"
+    consumer_id = "consumer_id"
+    monkeypatch.setattr(settings, "cleanup_batch_size", 2)
+
+    await services.create_topic(data=CreateTopic(id=topic_id))
+    await services.create_subscription(data=CreateSubscription(id=subscription_id, topic_id=topic_id))
+    await services.publish_messages(topic_id, messages)
+    messages = await services.consume_messages(subscription_id, consumer_id, 10)
+    await services.ack_messages(subscription_id, [message.id for message in messages])
+
+    time.sleep(1)
+
+    result = await services.cleanup_acked_messages(1)
+    assert result is True
+
+    db_messages = await get_db_messages(session, subscription_id)
+    assert len(db_messages) == 0
+
+
 @pytest.mark.asyncio
 async def test_subscription_metrics(session):
     topic_id = "my_topic"
@@ -314,6 +340,66 @@ async def test_subscription_metrics(session):
     assert metrics == expected_metrics
 
 
+@pytest.mark.asyncio
+async def test_concurrent_ack_messages(session, messages):
+    topic_id = "my_topic"
+    subscription_id = "my_sub"
+    consumer_id = "consumer_id"
+
+    await services.create_topic(data=CreateTopic(id=topic_id))
+    await services.create_subscription(data=CreateSubscription(id=subscription_id, topic_id=topic_id))
+    await services.publish_messages(topic_id, messages)
+    messages = await services.consume_messages(subscription_id, consumer_id, 10)
+
+    results = await asyncio.gather(
+        *(services.ack_messages(subscription_id, [message.id]) for message in messages)
+    )
+    assert results == [True, True, True]
+
+    db_messages = await get_db_messages(session, subscription_id)
+    assert {db_message.status for db_message in db_messages} == {"acked"}
+
+
+@pytest.mark.asyncio
+async def test_publish_messages_with_big_integer(session):
+    topic_id = "my_topic"
+    subscription_id = "my_sub"
+
+    await services.create_topic(data=CreateTopic(id=topic_id))
+    await services.create_subscription(data=CreateSubscription(id=subscription_id, topic_id=topic_id))
+
+    result = await services.publish_messages(topic_id, [{"value": 2**70}])
+    assert result == 1
+
+    messages = await services.consume_messages(subscription_id, "consumer_id", 10)
+    assert messages[0].payload == {"value": 2**70}
+
+
+@pytest.mark.asyncio
+async def test_publish_messages_with_topic_not_found(session, messages):
+    with pytest.raises(NotFoundError) as excinfo:
+        await services.publish_messages("not-found", messages)
+    assert str(excinfo.value) == "Topic not found"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "service,args",
+    [
+        (services.consume_messages, ("consumer_id", 10)),
+        (services.ack_messages, ([uuid.uuid7()],)),
+        (services.nack_messages, ([uuid.uuid7()],)),
+        (services.list_dlq_messages, ()),
+        (services.reprocess_dlq_messages, ([uuid.uuid7()],)),
+        (services.subscription_metrics, ()),
+    ],
+)
+async def test_subscription_operations_with_subscription_not_found(session, service, args):
+    with pytest.raises(NotFoundError) as excinfo:
+        await service("not-found", *args)
+    assert str(excinfo.value) == "Subscription not found"
+
+
 @pytest.mark.asyncio
 async def test_database_ping(session):
     assert await services.database_ping() is True
@@ -78,9 +78,26 @@ async def test_delete_subscription(session):
 
     await services.create_topic(data=CreateTopic(id=topic_id))
     await services.create_subscription(data=data)
+    # populate the cache
+    await services.get_subscription(subscription_id)
 
     await services.delete_subscription(subscription_id)
 
     with pytest.raises(NotFoundError) as excinfo:
         await services.get_subscription(subscription_id)
     assert "Subscription not found" in str(excinfo.value)
+
+
+@pytest.mark.asyncio
+async def test_delete_topic_invalidates_cached_subscriptions(session):
+    topic_id = "my_topic"
+    subscription_id = "my_sub"
+
+    await services.create_topic(data=CreateTopic(id=topic_id))
+    await services.create_subscription(data=CreateSubscription(id=subscription_id, topic_id=topic_id))
+    await services.get_subscription(subscription_id)
+
+    await services.delete_topic(topic_id)
+
+    with pytest.raises(NotFoundError):
+        await services.get_subscription(subscription_id)
@@ -47,6 +47,8 @@ async def test_list_topic(session):
 async def test_delete_topic(session):
     topic_id = "my_topic"
     await services.create_topic(data=CreateTopic(id=topic_id))
+    # populate the cache
+    await services.get_topic(topic_id)
 
     await services.delete_topic(topic_id)
 
@@ -40,3 +40,17 @@ def test_settings_subscription_backoff_order():
         "subscription_backoff_max_seconds must be greater than or equal to subscription_backoff_min_seconds"
         in str(excinfo.value)
     )
+
+
+def test_settings_api_num_workers_from_web_concurrency(monkeypatch):
+    """Test that WEB_CONCURRENCY sets the number of API workers.
+
+    Validates that the conventional WEB_CONCURRENCY variable is accepted
+    and that the prefixed variable takes precedence over it.
+    """
+    monkeypatch.setenv("WEB_CONCURRENCY", "3")
+    assert Settings().api_num_workers == 3
+
+    monkeypatch.setenv("FASTPUBSUB_API_NUM_WORKERS", "2")
+    assert Settings().api_num_workers == 2
+    assert Settings(api_num_workers=4).api_num_workers == 4
@@ -0,0 +1,74 @@
+"""Tests for database utilities."""
+
+from unittest import mock
+
+import pytest
+import sqlalchemy as sa
+from alembic.script import ScriptDirectory
+from sqlalchemy.orm import DeclarativeBase
+
+from fastpubsub.database import (
+    _column_getter,
+    _head_revision,
+    _MIGRATIONS_PATH,
+    engine,
+    run_migrations,
+    warm_up_pool,
+)
+
+
+class _TestBase(DeclarativeBase):
+    pass
+
+
+class _SingleColumn(_TestBase):
+    id = sa.Column(sa.Text, primary_key=True)
+
+    __tablename__ = "single_column"
+
+
+def test_column_getter_with_single_column():
+    """Test that the getter returns a tuple when the class has a single column."""
+    keys, getter = _column_getter(_SingleColumn)
+
+    assert keys == ("id",)
+    assert getter(_SingleColumn(id="my-id")) == ("my-id",)
+
+
+def test_head_revision_matches_alembic():
+    """Test that the head revision read from the file names is Alembic's head."""
+    script = ScriptDirectory(str(_MIGRATIONS_PATH))
+
+    assert _head_revision() == script.get_current_head()
+
+
+@pytest.mark.asyncio
+async def test_run_migrations_skips_alembic_at_head(async_engine):
+    """Test that upgrading an up-to-date database doesn't run Alembic."""
+    with mock.patch("alembic.command.upgrade") as mock_upgrade:
+        await run_migrations(command_type="upgrade", revision="head")
+
+    mock_upgrade.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_pool_returns_connections_when_one_fails(async_engine):
+    """Test that a failed checkout doesn't leave the opened connections checked out."""
+    real_connect = engine.connect
+    calls = 0
+
+    def connect():
+        nonlocal calls
+        calls += 1
+        if calls == 2:
+            failing = mock.Mock()
+            failing.start = mock.AsyncMock(side_effect=OSError("too many clients"))
+            return failing
+        return real_connect()
+
+    with mock.patch("fastpubsub.database.engine") as mock_engine:
+        mock_engine.connect.side_effect = connect
+        await warm_up_pool()
+
+    assert calls > 2
+    assert engine.pool.checkedout() == 0
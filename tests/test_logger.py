@@ -0,0 +1,59 @@
+"""Tests for logging utilities."""
+
+import logging
+import pathlib
+import sys
+import uuid
+
+import orjson
+
+from fastpubsub.logger import get_console_handler, get_logger, get_queue_handler, request_context
+
+
+def test_queue_handler_keeps_exc_info_and_request_context():
+    """Test that queued records keep their exception info and request context.
+
+    Validates that the formatting of the traceback is left to the console
+    handler and that the request context is added before the record is queued.
+    """
+    handler = get_queue_handler()
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = logging.LogRecord("test", logging.ERROR, __file__, 1, "failed %s", ("here",), sys.exc_info())
+
+    token = request_context.set({"request.url.path": "/topics"})
+    try:
+        assert handler.filter(record)
+    finally:
+        request_context.reset(token)
+    prepared = handler.prepare(record)
+
+    assert prepared.msg == "failed here"
+    assert prepared.args is None
+    assert prepared.exc_info[0] is ValueError
+    assert prepared.__dict__["request.url.path"] == "/topics"
+
+
+def test_get_logger_does_not_duplicate_handlers():
+    """Test that loggers share one queue handler and never get it twice."""
+    logger = get_logger("fastpubsub.tests.logger")
+    get_logger("fastpubsub.tests.logger")
+    other_logger = get_logger("fastpubsub.tests.other_logger")
+
+    assert logger.handlers == [get_queue_handler()]
+    assert other_logger.handlers == logger.handlers
+
+
+def test_console_handler_formats_records_as_json():
+    """Test that records, including non-JSON extra values, are rendered as JSON."""
+    handler = get_console_handler()
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, "running %s", ("migrations",), None)
+    record.revision_id = uuid.UUID(int=1)
+    record.location = pathlib.Path("/srv/migrations")
+
+    output = orjson.loads(handler.format(record))
+
+    assert output["message"] == "running migrations"
+    assert output["revision_id"] == "00000000-0000-0000-0000-000000000001"
+    assert output["location"] == "/srv/migrations"
@@ -0,0 +1,60 @@
+"""Tests for the command-line interface."""
+
+import argparse
+from unittest import mock
+
+import pytest
+
+from fastpubsub import main
+
+
+@pytest.mark.parametrize(
+    "value,expected", [("true", True), ("Yes", True), ("1", True), ("false", False), ("off", False)]
+)
+def test_parse_bool(value, expected):
+    assert main._parse_bool(value) is expected
+
+
+def test_parse_bool_invalid():
+    with pytest.raises(argparse.ArgumentTypeError):
+        main._parse_bool("maybe")
+
+
+def test_cli_create_client_arguments():
+    with mock.patch.object(main, "run_create_client") as mock_command:
+        main.cli(["create_client", "My Application", "topics:read", "false"])
+
+    mock_command.assert_called_once_with(name="My Application", scopes="topics:read", is_active=False)
+
+
+def test_cli_create_client_defaults():
+    with mock.patch.object(main, "run_create_client") as mock_command:
+        main.cli(["create_client", "My Application"])
+
+    mock_command.assert_called_once_with(name="My Application", scopes="*", is_active=True)
+
+
+def test_cli_generate_secret_key(capsys):
+    main.cli(["generate_secret_key"])
+
+    assert capsys.readouterr().out.startswith("new_secret=")
+
+
+def test_cli_requires_a_command():
+    with pytest.raises(SystemExit) as excinfo:
+        main.cli([])
+
+    assert excinfo.value.code == 2
+
+
+def test_add_command_without_docstring():
+    def command():
+        pass
+
+    parser = argparse.ArgumentParser()
+    subparsers = parser.add_subparsers(dest="command")
+
+    command_parser = main._add_command(subparsers, "command", command)
+
+    assert command_parser.description is None
+    assert parser.parse_args(["command"]).func is command